@@ -523,6 +523,7 @@ class LLMBackend(ABC):
             backend_name=self.get_provider_name(),
             model=model,
             start_time=time.time(),
+            start_mono_ns=time.monotonic_ns(),
         )
 
     def record_first_token(self) -> None:
@@ -531,8 +532,10 @@ class LLMBackend(ABC):
         Call this when the first content token is received from the stream.
         Only records the first call per API request.
         """
-        if self._current_api_call and self._current_api_call.time_to_first_token_ms == 0:
-            self._current_api_call.time_to_first_token_ms = (time.time() - self._current_api_call.start_time) * 1000
+        call = self._current_api_call
+        if call and not call.first_token_mono_ns:
+            call.first_token_mono_ns = time.monotonic_ns()
+            call.time_to_first_token_ms = (call.first_token_mono_ns - call.start_mono_ns) / 1e6
 
     def end_api_call_timing(self, success: bool = True, error: Optional[str] = None) -> None:
         """End timing and record the API call.
@@ -544,7 +547,9 @@ class LLMBackend(ABC):
             error: Error message if the call failed
         """
         if self._current_api_call:
-            self._current_api_call.end_time = time.time()
+            # Derive the wall-clock end from the monotonic duration so both stay consistent
+            self._current_api_call.end_mono_ns = time.monotonic_ns()
+            self._current_api_call.end_time = self._current_api_call.start_time + self._current_api_call.duration_ms / 1000
             self._current_api_call.success = success
             self._current_api_call.error_message = error
             self._api_call_history.append(self._current_api_call)
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import atexit
 import os
 import threading
 from typing import Iterable, List, Optional
@@ -11,6 +12,9 @@ _TRANSCRIPT_ENV = "MASSGEN_TUI_TIMELINE_TRANSCRIPT"
 _EMIT_EVENTS_ENV = "MASSGEN_TUI_TIMELINE_EVENTS"
 _MAX_LINE_LEN = 200
 _LOCK = threading.Lock()
+_FD: Optional[int] = None
+_FD_PATH: Optional[str] = None
+_FD_FILE_ID: Optional[tuple[int, int]] = None  # (st_dev, st_ino) of the open file
 
 
 def _get_path() -> Optional[str]:
@@ -24,16 +28,62 @@ def _truncate(text: str, max_len: int = _MAX_LINE_LEN) -> str:
 
 
 def _sanitize(text: str) -> str:
+    if "\r" not in text:
+        # Most lines are single-line; skip the replace copy when there is nothing to escape
+        if "\n" not in text:
+            return _truncate(text)
+        # Without \r every char maps to at least one output char, so only the head
+        # can survive truncation - escape just that instead of the whole payload
+        return _truncate(text[: _MAX_LINE_LEN + 1].replace("\n", "\\n"))
     return _truncate(text.replace("\n", "\\n").replace("\r", ""))
 
 
+def _get_fd(path: str) -> int:
+    """Return a cached append-mode fd for ``path``.
+
+    Reopens when the path changed or the file at ``path`` is no longer the one
+    the fd points to (deleted or rotated), so lines never go to an unlinked
+    inode. Must be called with ``_LOCK`` held.
+    """
+    global _FD, _FD_PATH, _FD_FILE_ID
+    if _FD is not None and _FD_PATH == path:
+        try:
+            st = os.stat(path)
+            if (st.st_dev, st.st_ino) == _FD_FILE_ID:
+                return _FD
+        except FileNotFoundError:
+            pass
+    _close_fd()
+    _FD = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    st = os.fstat(_FD)
+    _FD_PATH = path
+    _FD_FILE_ID = (st.st_dev, st.st_ino)
+    return _FD
+
+
+def _close_fd() -> None:
+    global _FD, _FD_PATH, _FD_FILE_ID
+    if _FD is not None:
+        try:
+            os.close(_FD)
+        except OSError:
+            pass
+    _FD = None
+    _FD_PATH = None
+    _FD_FILE_ID = None
+
+
+atexit.register(_close_fd)
+
+
 def _write_line(line: str) -> None:
     path = _get_path()
     if not path:
         return
     with _LOCK:
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        # One write(2) per line on a raw fd (plus a stat to catch rotation),
+        # skipping the per-call open() and text layer
+        os.write(_get_fd(path), (line + "\n").encode("utf-8"))
         if os.environ.get(_EMIT_EVENTS_ENV):
             try:
                 from massgen.events import emit_event
@@ -121,36 +171,69 @@ def record_batch_tool(tool_data, round_number: int, batch_id: str, action: str)
     _write_line(format_batch_tool(tool_data, round_number, batch_id, action))
 
 
+def _render_separator(output, output_type: str, round_number: int) -> List[str]:
+    label = getattr(output, "separator_label", None) or ""
+    subtitle = getattr(output, "separator_subtitle", None) or ""
+    return [format_separator(label, round_number, subtitle)]
+
+
+def _render_text(output, output_type: str, round_number: int) -> List[str]:
+    text = getattr(output, "text_content", None) or ""
+    text_class = getattr(output, "text_class", None) or output_type
+    return [format_text(text, text_class, round_number)]
+
+
+def _render_final_answer(output, output_type: str, round_number: int) -> List[str]:
+    text = getattr(output, "text_content", None) or ""
+    return [format_text(text, "final-answer", round_number)]
+
+
+def _render_tool(output, output_type: str, round_number: int) -> List[str]:
+    tool_data = getattr(output, "tool_data", None)
+    if not tool_data:
+        return []
+    action = getattr(output, "batch_action", None) or "add"
+    batch_id = getattr(output, "batch_id", None)
+    server_name = getattr(output, "server_name", None)
+    return [format_tool(tool_data, round_number, action, batch_id=batch_id, server_name=server_name)]
+
+
+def _render_tool_batch(output, output_type: str, round_number: int) -> List[str]:
+    batch_tools = getattr(output, "batch_tools", None)
+    if not batch_tools:
+        return []
+    batch_id = getattr(output, "batch_id", None) or "batch"
+    server_name = getattr(output, "server_name", None) or "tools"
+    lines = [format_batch(round_number, "start", batch_id, server_name)]
+    for tool in batch_tools:
+        lines.append(format_batch_tool(tool, round_number, batch_id, "add"))
+    return lines
+
+
+def _render_noop(output, output_type: str, round_number: int) -> List[str]:
+    return []
+
+
+_RENDER_DISPATCH = {
+    "separator": _render_separator,
+    "thinking": _render_text,
+    "text": _render_text,
+    "status": _render_text,
+    "presentation": _render_text,
+    "reminder": _render_text,
+    "injection": _render_text,
+    "final_answer": _render_final_answer,
+    "tool": _render_tool,
+    "tool_batch": _render_tool_batch,
+}
+
+
 def render_output(output) -> List[str]:
     """Render ContentOutput-like object into transcript lines."""
-    lines: List[str] = []
     round_number = getattr(output, "round_number", None) or 1
     output_type = getattr(output, "output_type", "")
-
-    if output_type == "separator":
-        label = getattr(output, "separator_label", "") or ""
-        subtitle = getattr(output, "separator_subtitle", "") or ""
-        lines.append(format_separator(label, round_number, subtitle))
-    elif output_type in ("thinking", "text", "status", "presentation", "reminder", "injection"):
-        text = getattr(output, "text_content", "") or ""
-        text_class = getattr(output, "text_class", "") or output_type
-        lines.append(format_text(text, text_class, round_number))
-    elif output_type == "final_answer":
-        text = getattr(output, "text_content", "") or ""
-        lines.append(format_text(text, "final-answer", round_number))
-    elif output_type == "tool" and getattr(output, "tool_data", None):
-        tool_data = output.tool_data
-        action = getattr(output, "batch_action", None) or "add"
-        batch_id = getattr(output, "batch_id", None)
-        server_name = getattr(output, "server_name", None)
-        lines.append(format_tool(tool_data, round_number, action, batch_id=batch_id, server_name=server_name))
-    elif output_type == "tool_batch" and getattr(output, "batch_tools", None):
-        batch_id = getattr(output, "batch_id", "") or "batch"
-        server_name = getattr(output, "server_name", "") or "tools"
-        lines.append(format_batch(round_number, "start", batch_id, server_name))
-        for tool in output.batch_tools:
-            lines.append(format_batch_tool(tool, round_number, batch_id, "add"))
-    return lines
+    handler = _RENDER_DISPATCH.get(output_type, _render_noop)
+    return handler(output, output_type, round_number)
 
 
 def render_outputs(outputs: Iterable) -> List[str]:
@@ -21,15 +21,22 @@ Built-in Hooks:
 
 import asyncio
 import fnmatch
+import functools
 import importlib
+import inspect
 import json
+import os
+import re
 import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, List, Literal, Optional, Tuple, Union
 
 from ..logger_config import logger
 
@@ -46,6 +53,43 @@ except ImportError:
     ProgressFnT = None
 
 
+# orjson is optional (the "speedups" extra); it parses tool arguments and outputs
+# noticeably faster. Serialization stays on the stdlib so re-serialized arguments
+# keep json.dumps formatting regardless of what is installed.
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when available, with the stdlib's results.
+
+    orjson rejects input the stdlib accepts (NaN/Infinity, integers wider than
+    64 bits), so anything it refuses is re-parsed with json.loads, which also
+    raises the usual json.JSONDecodeError for genuinely invalid input.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+# Read-only stand-in for a missing hook context (avoids allocating a dict per call)
+_EMPTY_CONTEXT: MappingProxyType = MappingProxyType({})
+
+# Characters that make a matcher pattern a glob rather than a literal tool name
+_GLOB_CHARS = frozenset("*?[")
+
+# Upper bound on cached (agent, hook type, tool name) lookups in GeneralHookManager
+MATCH_CACHE_MAX_ENTRIES = 4096
+
+
 class HookType(Enum):
     """Types of function call hooks."""
 
@@ -58,7 +102,14 @@ class HookType(Enum):
     POST_TOOL_USE = "PostToolUse"
 
 
-@dataclass
+# Config section names accepted by GeneralHookManager.register_hooks_from_config
+_CONFIG_HOOK_TYPES = {
+    "PreToolUse": HookType.PRE_TOOL_USE,
+    "PostToolUse": HookType.POST_TOOL_USE,
+}
+
+
+@dataclass(slots=True)
 class HookEvent:
     """Input data provided to all hooks.
 
@@ -93,7 +144,49 @@ class HookEvent:
         return json.dumps(self.to_dict())
 
 
-@dataclass
+_UNPARSED = object()
+
+
+class _LazyHookEvent(HookEvent):
+    """HookEvent that parses its tool arguments on first access to ``tool_input``.
+
+    Many hooks only look at ``tool_name`` or ``tool_output``, so the JSON parse
+    is skipped unless the handler actually reads the input. Behaves like a
+    regular HookEvent otherwise (equality, ``to_dict`` and assignment all go
+    through the property). Equality compares fields, so a lazy event equals a
+    plain HookEvent carrying the same parsed input.
+    """
+
+    def __init__(self, *, raw_arguments: str = "{}", tool_input: Any = _UNPARSED, **event_fields: Any):
+        # An explicit tool_input (e.g. from dataclasses.replace) skips the lazy parse
+        self._raw_arguments = raw_arguments
+        self._tool_input = tool_input
+        super().__init__(tool_input=tool_input, **event_fields)
+
+    @property
+    def tool_input(self) -> Dict[str, Any]:
+        if self._tool_input is _UNPARSED:
+            raw = self._raw_arguments
+            try:
+                # "{}" is by far the most common payload; skip the parser for it
+                self._tool_input = _json_loads(raw) if raw and raw != "{}" else {}
+            except json.JSONDecodeError:
+                self._tool_input = {"raw": raw}
+        return self._tool_input
+
+    @tool_input.setter
+    def tool_input(self, value: Dict[str, Any]) -> None:
+        if value is not _UNPARSED:
+            self._tool_input = value
+
+    def __eq__(self, other: object) -> bool:
+        # The dataclass __eq__ requires an exact class match
+        if not isinstance(other, HookEvent):
+            return NotImplemented
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(HookEvent))
+
+
+@dataclass(slots=True)
 class HookResult:
     """Result of a hook execution.
 
@@ -103,6 +196,13 @@ class HookResult:
     The `hook_errors` field tracks any errors that occurred during hook execution
     when using fail-open behavior. This allows callers to be aware of partial
     failures even when the overall result is "allow".
+
+    Note that `metadata`, `hook_errors` and `executed_hooks` may be read-only:
+    the shared `HookResult.ALLOW` instance (returned by built-in hooks with
+    nothing to contribute) holds a mappingproxy and tuples there and rejects
+    attribute assignment. Results from the constructor or `allow()` own a
+    fresh dict/list; copy into one of those before mutating a result that a
+    hook returned.
     """
 
     # Legacy fields (for backward compatibility)
@@ -128,6 +228,11 @@ class HookResult:
     # Each entry: {"hook_name": str, "hook_type": str, "decision": str, "reason": str, "execution_time_ms": float, "injection_preview": str}
     executed_hooks: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Shared read-only "allow, no changes" result (assigned below the class).
+    # Return it from hooks that have nothing to contribute; use allow() for a
+    # result that will be mutated (e.g. add_error).
+    ALLOW: ClassVar["HookResult"]
+
     def __post_init__(self):
         """Sync legacy and new fields for compatibility."""
         # Sync decision with allowed
@@ -201,6 +306,37 @@ class HookResult:
         return cls(allowed=True, decision="ask", reason=reason)
 
 
+class _SharedHookResult(HookResult):
+    """Read-only HookResult interned for pass-through paths.
+
+    Built once at import so the common "allow, no changes" outcome skips
+    dataclass ``__init__``/``__post_init__`` work. Attribute assignment is
+    rejected after construction and the containers are immutable, so an
+    accidental mutation fails loudly instead of leaking into other calls.
+    Callers that need to mutate a result must use ``HookResult.allow()``.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get("_sealed"):
+            raise AttributeError(f"Shared HookResult is read-only (tried to set '{name}')")
+        super().__setattr__(name, value)
+
+    def _seal(self) -> "_SharedHookResult":
+        self.__dict__["_sealed"] = True
+        return self
+
+
+# Canonical allow result returned when no hook has anything to contribute
+_ALLOW = _SharedHookResult(
+    allowed=True,
+    decision="allow",
+    metadata=MappingProxyType({}),
+    hook_errors=(),
+    executed_hooks=(),
+)._seal()
+HookResult.ALLOW = _ALLOW
+
+
 class FunctionHook(ABC):
     """Base class for function call hooks."""
 
@@ -270,6 +406,16 @@ class FunctionHookManager:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_globs(globs: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile glob patterns into a single OR'ed regex.
+
+    Cached because the same matcher (e.g. "mcp__*") is typically configured
+    on many hooks across agents.
+    """
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs))
+
+
 class PatternHook(FunctionHook):
     """Base class for hooks that support pattern-based tool matching."""
 
@@ -291,6 +437,18 @@ class PatternHook(FunctionHook):
         self.matcher = matcher
         self.timeout = timeout
         self._patterns = self._parse_matcher(matcher)
+        # Most hooks use "*"; plain tool names need only a set lookup and
+        # "prefix*" / "*suffix" patterns a startswith / endswith. Remaining
+        # globs are OR'ed into one regex compiled once (fnmatch re-translates
+        # per call).
+        self._match_all = "*" in self._patterns
+        self._literals = frozenset(p for p in self._patterns if not _GLOB_CHARS.intersection(p))
+        globs = [p for p in self._patterns if _GLOB_CHARS.intersection(p)]
+        self._prefixes = tuple(p[:-1] for p in globs if p.endswith("*") and not _GLOB_CHARS.intersection(p[:-1]))
+        globs = [p for p in globs if not (p.endswith("*") and p[:-1] in self._prefixes)]
+        self._suffixes = tuple(p[1:] for p in globs if p.startswith("*") and p[1:] and not _GLOB_CHARS.intersection(p[1:]))
+        globs = [p for p in globs if not (p.startswith("*") and p[1:] in self._suffixes)]
+        self._regex = _compile_globs(tuple(globs)) if globs else None
 
     def _parse_matcher(self, matcher: str) -> List[str]:
         """Parse matcher into list of patterns (supports | for OR)."""
@@ -300,10 +458,42 @@ class PatternHook(FunctionHook):
 
     def matches(self, tool_name: str) -> bool:
         """Check if this hook matches the given tool name."""
-        for pattern in self._patterns:
-            if fnmatch.fnmatch(tool_name, pattern):
-                return True
-        return False
+        if self._match_all or tool_name in self._literals:
+            return True
+        if self._prefixes and tool_name.startswith(self._prefixes):
+            return True
+        if self._suffixes and tool_name.endswith(self._suffixes):
+            return True
+        return self._regex is not None and self._regex.match(tool_name) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _import_callable(path: str) -> Callable:
+    """Import a callable from a module path.
+
+    Cached so hooks sharing a handler path (e.g. the same hook configured
+    for several agents) resolve it once. The path may continue past the
+    module into nested attributes, e.g. "package.module.Class.method".
+    """
+    module_path, _, attr_path = path.rpartition(".")
+    if not module_path:
+        raise ImportError(f"Invalid callable path: {path}")
+    attrs = [attr_path]
+    while True:
+        try:
+            obj = importlib.import_module(module_path)
+            break
+        except ModuleNotFoundError as e:
+            # Only step back when the missing module is the one we asked for;
+            # a missing dependency inside a real module should surface as-is
+            parent_path, _, attr = module_path.rpartition(".")
+            if e.name != module_path or not parent_path:
+                raise
+            module_path = parent_path
+            attrs.insert(0, attr)
+    for attr in attrs:
+        obj = getattr(obj, attr)
+    return obj
 
 
 class PythonCallableHook(PatternHook):
@@ -316,6 +506,9 @@ class PythonCallableHook(PatternHook):
     The callable receives a HookEvent and returns a HookResult (or dict).
     """
 
+    # Shared, bounded pool for sync callables (created on first use)
+    _executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(
         self,
         name: str,
@@ -338,16 +531,18 @@ class PythonCallableHook(PatternHook):
         super().__init__(name, matcher, timeout)
         self._handler_path = handler if isinstance(handler, str) else None
         self._callable: Optional[Callable] = handler if callable(handler) else None
+        self._is_coro = asyncio.iscoroutinefunction(self._callable) if self._callable else False
         self.fail_closed = fail_closed
 
-    def _import_callable(self, path: str) -> Callable:
-        """Import a callable from a module path."""
-        parts = path.rsplit(".", 1)
-        if len(parts) != 2:
-            raise ImportError(f"Invalid callable path: {path}")
-        module_path, func_name = parts
-        module = importlib.import_module(module_path)
-        return getattr(module, func_name)
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Return the pool shared by all sync hook callables."""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 2),
+                thread_name_prefix="massgen-hook",
+            )
+        return cls._executor
 
     async def execute(
         self,
@@ -358,52 +553,46 @@ class PythonCallableHook(PatternHook):
     ) -> HookResult:
         """Execute the Python callable hook."""
         if not self.matches(function_name):
-            return HookResult.allow()
+            return _ALLOW
 
         # Lazy load callable
         if self._callable is None and self._handler_path:
             try:
-                self._callable = self._import_callable(self._handler_path)
+                self._callable = _import_callable(self._handler_path)
+                self._is_coro = asyncio.iscoroutinefunction(self._callable)
             except Exception as e:
                 logger.error(f"[PythonCallableHook] Failed to import {self._handler_path}: {e}")
                 # Fail closed on import error
                 return HookResult.deny(reason=f"Hook import failed: {e}")
 
         if self._callable is None:
-            return HookResult.allow()
+            return _ALLOW
 
         # Build HookEvent
-        ctx = context or {}
-        try:
-            tool_input = json.loads(arguments) if arguments else {}
-        except json.JSONDecodeError:
-            tool_input = {"raw": arguments}
-
-        event = HookEvent(
+        ctx = context if context is not None else _EMPTY_CONTEXT
+        event = _LazyHookEvent(
+            raw_arguments=arguments,
             hook_type=ctx.get("hook_type", "PreToolUse"),
             session_id=ctx.get("session_id", ""),
             orchestrator_id=ctx.get("orchestrator_id", ""),
             agent_id=ctx.get("agent_id"),
             timestamp=datetime.now(timezone.utc),
             tool_name=function_name,
-            tool_input=tool_input,
             tool_output=ctx.get("tool_output"),
         )
 
         try:
-            # Execute with timeout
-            if asyncio.iscoroutinefunction(self._callable):
-                result = await asyncio.wait_for(
-                    self._callable(event),
-                    timeout=self.timeout,
-                )
-            else:
-                # Sync callable - run in executor
-                loop = asyncio.get_event_loop()
-                result = await asyncio.wait_for(
-                    loop.run_in_executor(None, self._callable, event),
-                    timeout=self.timeout,
-                )
+            # Execute with timeout (asyncio.timeout avoids wait_for's extra task per call)
+            async with asyncio.timeout(self.timeout):
+                if self._is_coro:
+                    result = await self._callable(event)
+                else:
+                    # Sync callable - run in the shared executor. Wrappers and objects
+                    # with an async __call__ hand back an awaitable, awaited here on the loop
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(self._get_executor(), self._callable, event)
+                    if inspect.isawaitable(result):
+                        result = await result
 
             return self._normalize_result(result)
 
@@ -411,12 +600,12 @@ class PythonCallableHook(PatternHook):
             logger.warning(f"[PythonCallableHook] Hook {self.name} timed out for {function_name}")
             if self.fail_closed:
                 return HookResult.deny(reason=f"Hook {self.name} timed out")
-            return HookResult.allow()
+            return _ALLOW
         except Exception as e:
             logger.error(f"[PythonCallableHook] Hook {self.name} failed: {e}")
             if self.fail_closed:
                 return HookResult.deny(reason=f"Hook {self.name} failed: {e}")
-            return HookResult.allow()
+            return _ALLOW
 
     def _normalize_result(self, result: Any) -> HookResult:
         """Normalize hook result to HookResult."""
@@ -425,10 +614,10 @@ class PythonCallableHook(PatternHook):
         if isinstance(result, dict):
             return HookResult.from_dict(result)
         if result is None:
-            return HookResult.allow()
+            return _ALLOW
         # Unknown type - treat as allow
         logger.warning(f"[PythonCallableHook] Unknown result type: {type(result)}")
-        return HookResult.allow()
+        return _ALLOW
 
 
 class GeneralHookManager:
@@ -448,12 +637,43 @@ class GeneralHookManager:
         }
         self._agent_hooks: Dict[str, Dict[HookType, List[PatternHook]]] = {}
         self._agent_overrides: Dict[str, Dict[HookType, bool]] = {}
+        # LRU of (agent_id, hook_type, tool_name) -> (matching hooks, registered count).
+        # The same tools are called over and over, so the filter result is reusable.
+        self._match_cache: "OrderedDict[Tuple[Optional[str], HookType, str], Tuple[Tuple[PatternHook, ...], int]]" = OrderedDict()
+        # (agent_id, hook_type) -> merged global + agent hooks
+        self._merged_cache: Dict[Tuple[Optional[str], HookType], Tuple[PatternHook, ...]] = {}
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached hook lookups after the registry changes."""
+        self._match_cache.clear()
+        self._merged_cache.clear()
+
+    def _get_matching_hooks(
+        self,
+        agent_id: Optional[str],
+        hook_type: HookType,
+        function_name: str,
+    ) -> Tuple[Tuple[PatternHook, ...], int]:
+        """Return hooks matching ``function_name`` and the number of hooks registered."""
+        key = (agent_id, hook_type, function_name)
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            self._match_cache.move_to_end(key)
+            return cached
+
+        hooks = self.get_hooks_for_agent(agent_id, hook_type)
+        cached = (tuple(h for h in hooks if h.matches(function_name)), len(hooks))
+        self._match_cache[key] = cached
+        if len(self._match_cache) > MATCH_CACHE_MAX_ENTRIES:
+            self._match_cache.popitem(last=False)
+        return cached
 
     def register_global_hook(self, hook_type: HookType, hook: PatternHook) -> None:
         """Register a hook that applies to all agents."""
         if hook_type not in self._global_hooks:
             self._global_hooks[hook_type] = []
         self._global_hooks[hook_type].append(hook)
+        self._invalidate_caches()
         logger.debug(f"[GeneralHookManager] Registered global {hook_type.value} hook: {hook.name}")
 
     def register_agent_hook(
@@ -489,6 +709,8 @@ class GeneralHookManager:
         if override:
             self._agent_overrides[agent_id][hook_type] = True
 
+        self._invalidate_caches()
+
         logger.debug(
             f"[GeneralHookManager] Registered {hook_type.value} hook for agent {agent_id}: {hook.name}" f"{' (override)' if override else ''}",
         )
@@ -497,12 +719,26 @@ class GeneralHookManager:
         self,
         agent_id: Optional[str],
         hook_type: HookType,
-    ) -> List[PatternHook]:
+    ) -> Tuple[PatternHook, ...]:
         """Get all applicable hooks for an agent.
 
         If the agent has override=True for this hook type, only agent hooks are returned.
         Otherwise, global hooks are returned first, then agent hooks.
+
+        The merged tuple is cached until the next registration change.
         """
+        key = (agent_id, hook_type)
+        hooks = self._merged_cache.get(key)
+        if hooks is None:
+            hooks = self._merged_cache[key] = tuple(self._compute_hooks_for_agent(agent_id, hook_type))
+        return hooks
+
+    def _compute_hooks_for_agent(
+        self,
+        agent_id: Optional[str],
+        hook_type: HookType,
+    ) -> List[PatternHook]:
+        """Merge global and agent hooks, honouring per-agent overrides."""
         hooks = []
 
         # Check if agent overrides global hooks for this type
@@ -536,6 +772,8 @@ class GeneralHookManager:
 
         For PostToolUse:
         - All injection content is collected
+        - Hooks run concurrently (they only inject, so none depends on another);
+          results are still aggregated in registration order
 
         Args:
             hook_type: The type of hook (PRE_TOOL_USE or POST_TOOL_USE)
@@ -548,37 +786,43 @@ class GeneralHookManager:
             Aggregated HookResult from all matching hooks
         """
         agent_id = context.get("agent_id")
-        hooks = self.get_hooks_for_agent(agent_id, hook_type)
+        matching_hooks, registered_count = self._get_matching_hooks(agent_id, hook_type, function_name)
 
         # Add tool_output to context for PostToolUse hooks
         if tool_output is not None:
             context["tool_output"] = tool_output
 
-        if not hooks:
+        if not registered_count:
             logger.info(f"[GeneralHookManager] No hooks registered for agent_id={agent_id}, hook_type={hook_type}")
-            return HookResult.allow()
+            return _ALLOW
 
-        # Filter to matching hooks
-        matching_hooks = [h for h in hooks if h.matches(function_name)]
-        logger.info(f"[GeneralHookManager] {len(matching_hooks)} matching hooks for {function_name} (out of {len(hooks)} registered)")
+        logger.info(f"[GeneralHookManager] {len(matching_hooks)} matching hooks for {function_name} (out of {registered_count} registered)")
 
         if not matching_hooks:
-            return HookResult.allow()
+            return _ALLOW
 
         final_result = HookResult.allow()
         modified_args = arguments
-        all_injections: List[Dict[str, Any]] = []
+        injection_contents: List[str] = []
+        injection_strategy: Optional[str] = None
         hook_type_str = "pre" if hook_type == HookType.PRE_TOOL_USE else "post"
 
-        for hook in matching_hooks:
-            start_time = time.time()
-            try:
-                # Update context with current args
-                ctx = dict(context)
-                result = await hook.execute(function_name, modified_args, ctx)
+        # PostToolUse hooks are independent, so run them together: wall time is the
+        # slowest hook rather than the sum. PreToolUse must chain modified args.
+        concurrent_outcomes = None
+        if hook_type == HookType.POST_TOOL_USE and len(matching_hooks) > 1:
+            concurrent_outcomes = await asyncio.gather(
+                *(self._execute_timed(hook, function_name, arguments, context) for hook in matching_hooks),
+            )
 
-                # Calculate execution time
-                execution_time_ms = (time.time() - start_time) * 1000
+        for index, hook in enumerate(matching_hooks):
+            if concurrent_outcomes is not None:
+                result, execution_time_ms = concurrent_outcomes[index]
+            else:
+                result, execution_time_ms = await self._execute_timed(hook, function_name, modified_args, context)
+            try:
+                if isinstance(result, Exception):
+                    raise result
 
                 # Handle deny - short circuit
                 if not result.allowed or result.decision == "deny":
@@ -627,9 +871,11 @@ class GeneralHookManager:
                 elif result.updated_input is not None:
                     modified_args = json.dumps(result.updated_input)
 
-                # Collect injections
+                # Collect injections (content strings only; the last strategy wins)
                 if result.inject:
-                    all_injections.append(result.inject)
+                    injection_strategy = result.inject.get("strategy", "tool_result")
+                    if injection_content:
+                        injection_contents.append(injection_content)
 
                 # Propagate any errors from the individual hook result
                 if result.has_errors():
@@ -637,7 +883,6 @@ class GeneralHookManager:
                         final_result.add_error(err)
 
             except Exception as e:
-                execution_time_ms = (time.time() - start_time) * 1000
                 error_msg = f"Hook '{hook.name}' failed unexpectedly: {e}"
                 logger.error(f"[GeneralHookManager] {error_msg}", exc_info=True)
                 # Track the error but fail open (allow tool execution to proceed)
@@ -659,17 +904,30 @@ class GeneralHookManager:
 
         # Build final result
         final_result.modified_args = modified_args if modified_args != arguments else None
-        if all_injections:
-            # Combine injections
-            combined_content = "\n".join(inj.get("content", "") for inj in all_injections if inj.get("content"))
-            if combined_content:
-                final_result.inject = {
-                    "content": combined_content,
-                    "strategy": all_injections[-1].get("strategy", "tool_result"),
-                }
+        if injection_contents:
+            final_result.inject = {
+                "content": "\n".join(injection_contents),
+                "strategy": injection_strategy,
+            }
 
         return final_result
 
+    @staticmethod
+    async def _execute_timed(
+        hook: PatternHook,
+        function_name: str,
+        arguments: str,
+        context: Dict[str, Any],
+    ) -> Tuple[Union[HookResult, Exception], float]:
+        """Run one hook, returning its result (or the exception it raised) and duration in ms."""
+        start_time = time.time()
+        try:
+            # Hooks only read the context, so it is shared rather than copied per hook
+            result = await hook.execute(function_name, arguments, context)
+        except Exception as e:
+            result = e
+        return result, (time.time() - start_time) * 1000
+
     def register_hooks_from_config(
         self,
         hooks_config: Dict[str, Any],
@@ -695,16 +953,11 @@ class GeneralHookManager:
             agent_id: If provided, register as agent-specific hooks.
                      If None, register as global hooks that apply to all agents.
         """
-        hook_type_map = {
-            "PreToolUse": HookType.PRE_TOOL_USE,
-            "PostToolUse": HookType.POST_TOOL_USE,
-        }
-
         for hook_type_name, hook_configs in hooks_config.items():
             if hook_type_name == "override":
                 continue
 
-            hook_type = hook_type_map.get(hook_type_name)
+            hook_type = _CONFIG_HOOK_TYPES.get(hook_type_name)
             if not hook_type:
                 logger.warning(f"[GeneralHookManager] Unknown hook type: {hook_type_name}")
                 continue
@@ -753,6 +1006,7 @@ class GeneralHookManager:
         }
         self._agent_hooks.clear()
         self._agent_overrides.clear()
+        self._invalidate_caches()
 
 
 # =============================================================================
@@ -809,7 +1063,7 @@ class MidStreamInjectionHook(PatternHook):
         Errors are tracked in the result so callers can be aware of injection failures.
         """
         if not self._injection_callback:
-            return HookResult.allow()
+            return _ALLOW
 
         try:
             # Get injection content from callback (supports both sync and async)
@@ -839,7 +1093,7 @@ class MidStreamInjectionHook(PatternHook):
             result.metadata["injection_skipped"] = True
             return result
 
-        return HookResult.allow()
+        return _ALLOW
 
 
 class SubagentCompleteHook(PatternHook):
@@ -907,13 +1161,13 @@ class SubagentCompleteHook(PatternHook):
             HookResult: Indicates success or failure and includes any payload.
         """
         if not self._get_pending_results:
-            return HookResult.allow()
+            return _ALLOW
 
         try:
             # Get pending results (getter should also clear them)
             pending = self._get_pending_results()
             if not pending:
-                return HookResult.allow()
+                return _ALLOW
 
             # Format results for injection
             from massgen.subagent.result_formatter import format_batch_results
@@ -941,6 +1195,20 @@ class SubagentCompleteHook(PatternHook):
             return result
 
 
+_REMINDER_SEPARATOR = "=" * 60
+
+# The reminder has no dynamic fields, so it is rendered once at import time
+_HIGH_PRIORITY_REMINDER = (
+    f"\n{_REMINDER_SEPARATOR}\n⚠️  SYSTEM REMINDER\n{_REMINDER_SEPARATOR}\n\n"
+    "✓ High-priority task completed! Document decisions to optimize future work:\n"
+    "  • Which skills/tools were effective (or not)? → memory/long_term/skill_effectiveness.md\n"
+    "  • What approach worked (or failed) and why? → memory/long_term/approach_patterns.md\n"
+    "  • What would prevent mistakes on similar tasks? → memory/long_term/lessons_learned.md\n"
+    "  • User preferences revealed? → memory/short_term/user_prefs.md"
+    f"\n\n{_REMINDER_SEPARATOR}\n"
+)
+
+
 class HighPriorityTaskReminderHook(PatternHook):
     """PostToolUse hook that injects reminder when high-priority task is completed.
 
@@ -958,15 +1226,7 @@ class HighPriorityTaskReminderHook(PatternHook):
 
     def _format_reminder(self) -> str:
         """Format the high-priority task completion reminder."""
-        separator = "=" * 60
-        reminder_text = (
-            "✓ High-priority task completed! Document decisions to optimize future work:\n"
-            "  • Which skills/tools were effective (or not)? → memory/long_term/skill_effectiveness.md\n"
-            "  • What approach worked (or failed) and why? → memory/long_term/approach_patterns.md\n"
-            "  • What would prevent mistakes on similar tasks? → memory/long_term/lessons_learned.md\n"
-            "  • User preferences revealed? → memory/short_term/user_prefs.md"
-        )
-        return f"\n{separator}\n⚠️  SYSTEM REMINDER\n{separator}\n\n{reminder_text}\n\n{separator}\n"
+        return _HIGH_PRIORITY_REMINDER
 
     async def execute(
         self,
@@ -978,15 +1238,25 @@ class HighPriorityTaskReminderHook(PatternHook):
         """Execute the high-priority task reminder hook."""
         # Check pattern match first (only fires for update_task_status)
         if not self.matches(function_name):
-            return HookResult.allow()
+            return _ALLOW
 
-        tool_output = (context or {}).get("tool_output")
+        tool_output = (context or _EMPTY_CONTEXT).get("tool_output")
         if not tool_output:
-            return HookResult.allow()
+            return _ALLOW
+
+        # Cheap rejection before parsing: a completed high-priority task must
+        # contain both literal string values, and most tool outputs do not
+        if isinstance(tool_output, str):
+            if '"completed"' not in tool_output or '"high"' not in tool_output:
+                return _ALLOW
+            # Only a JSON object can carry a task, so plain text never needs
+            # to go through json parsing and JSONDecodeError unwinding
+            if tool_output.lstrip()[:1] != "{":
+                return _ALLOW
 
         try:
             # Parse tool output to check task details
-            result_dict = json.loads(tool_output)
+            result_dict = _json_loads(tool_output)
             if isinstance(result_dict, dict):
                 task = result_dict.get("task", {})
                 # Check if high-priority task was completed
@@ -1002,7 +1272,7 @@ class HighPriorityTaskReminderHook(PatternHook):
         except (json.JSONDecodeError, TypeError):
             pass
 
-        return HookResult.allow()
+        return _ALLOW
 
 
 class RoundTimeoutState:
@@ -1125,18 +1395,18 @@ class RoundTimeoutPostHook(PatternHook):
     ) -> HookResult:
         """Execute the soft timeout check after each tool call."""
         if self._soft_timeout_fired:
-            return HookResult.allow()
+            return _ALLOW
 
         timeout = self._get_timeout_for_current_round()
         if timeout is None:
-            return HookResult.allow()
+            return _ALLOW
 
         elapsed = time.time() - self.get_round_start_time()
         logger.debug(
             f"[RoundTimeoutPostHook] Agent {self.agent_id}: " f"elapsed={elapsed:.0f}s, soft_timeout={timeout}s, soft_fired={self._soft_timeout_fired}",
         )
         if elapsed < timeout:
-            return HookResult.allow()
+            return _ALLOW
 
         self._soft_timeout_fired = True
         # Record timestamp for hard timeout coordination
@@ -1258,7 +1528,7 @@ class RoundTimeoutPreHook(PatternHook):
         """
         timeout = self._get_timeout_for_current_round()
         if timeout is None:
-            return HookResult.allow()
+            return _ALLOW
 
         # If using shared state, check if soft timeout has fired first
         if self._shared_state:
@@ -1284,7 +1554,7 @@ class RoundTimeoutPreHook(PatternHook):
                 logger.debug(
                     f"[RoundTimeoutPreHook] Agent {self.agent_id}: " f"soft timeout not fired yet, allowing {function_name}",
                 )
-                return HookResult.allow()
+                return _ALLOW
 
             # Calculate hard timeout from when soft was injected
             time_since_soft = time.time() - soft_fired_at
@@ -1295,13 +1565,13 @@ class RoundTimeoutPreHook(PatternHook):
             if time_since_soft < self.grace_seconds:
                 # Within grace period - reset denial count and allow
                 self._shared_state.reset_denial_count()
-                return HookResult.allow()
+                return _ALLOW
 
             # Hard timeout reached - only allow vote/new_answer
             if function_name in ("vote", "new_answer"):
                 # Valid terminal tool - reset denial count
                 self._shared_state.reset_denial_count()
-                return HookResult.allow()
+                return _ALLOW
 
             # Block this tool and track the denial
             denial_count = self._shared_state.consecutive_hard_denials + 1
@@ -1333,11 +1603,11 @@ class RoundTimeoutPreHook(PatternHook):
         hard_timeout = timeout + self.grace_seconds
 
         if elapsed < hard_timeout:
-            return HookResult.allow()
+            return _ALLOW
 
         # Hard timeout reached - only allow vote/new_answer
         if function_name in ("vote", "new_answer"):
-            return HookResult.allow()
+            return _ALLOW
 
         # Block all other tools
         logger.warning(
@@ -1547,7 +1817,7 @@ class HumanInputHook(PatternHook):
             HookResult with injection content if any messages pending for this agent
         """
         # Get agent_id from context
-        agent_id = (context or {}).get("agent_id", "unknown")
+        agent_id = (context or _EMPTY_CONTEXT).get("agent_id", "unknown")
 
         messages_to_inject = []
         is_first_injection = False
@@ -1594,7 +1864,7 @@ class HumanInputHook(PatternHook):
                 },
             )
 
-        return HookResult.allow()
+        return _ALLOW
 
 
 __all__ = [
@@ -54,7 +54,7 @@ _current_round_type: ContextVar[Optional[str]] = ContextVar(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ObservabilityConfig:
     """Configuration for structured logging and observability."""
 
@@ -261,6 +261,9 @@ class TracerProxy:
         Yields:
             Span object if Logfire is enabled, otherwise a no-op context.
         """
+        if not _logfire_enabled:
+            yield _NOOP_SPAN
+            return
         logfire = self._get_logfire()
         if logfire:
             with logfire.span(name, **attributes or {}) as span:
@@ -271,10 +274,13 @@ class TracerProxy:
                         span.record_exception(e)
                     raise
         else:
-            yield _NoOpSpan()
+            yield _NOOP_SPAN
 
     def info(self, message: str, **kwargs):
         """Log an info message with optional attributes."""
+        if not _logfire_enabled:
+            logger.info(message)
+            return
         logfire = self._get_logfire()
         if logfire:
             logfire.info(message, **kwargs)
@@ -283,6 +289,9 @@ class TracerProxy:
 
     def debug(self, message: str, **kwargs):
         """Log a debug message with optional attributes."""
+        if not _logfire_enabled:
+            logger.debug(message)
+            return
         logfire = self._get_logfire()
         if logfire:
             logfire.debug(message, **kwargs)
@@ -291,6 +300,9 @@ class TracerProxy:
 
     def warning(self, message: str, **kwargs):
         """Log a warning message with optional attributes."""
+        if not _logfire_enabled:
+            logger.warning(message)
+            return
         logfire = self._get_logfire()
         if logfire:
             logfire.warn(message, **kwargs)
@@ -299,6 +311,9 @@ class TracerProxy:
 
     def error(self, message: str, **kwargs):
         """Log an error message with optional attributes."""
+        if not _logfire_enabled:
+            logger.error(message)
+            return
         logfire = self._get_logfire()
         if logfire:
             logfire.error(message, **kwargs)
@@ -428,8 +443,12 @@ class _NoOpSpan:
         pass
 
 
-# Global tracer instance
-_tracer: Optional[TracerProxy] = None
+# Shared no-op span; it holds no state, so one instance serves every caller
+_NOOP_SPAN = _NoOpSpan()
+
+
+# Global tracer instance (construction is trivial; logfire is resolved lazily)
+_tracer: TracerProxy = TracerProxy()
 
 
 def get_tracer() -> TracerProxy:
@@ -439,9 +458,6 @@ def get_tracer() -> TracerProxy:
     Returns:
         TracerProxy that can be used for creating spans and logging.
     """
-    global _tracer
-    if _tracer is None:
-        _tracer = TracerProxy()
     return _tracer
 
 
@@ -494,36 +510,32 @@ def trace_llm_call(
     Returns:
         Decorator function.
     """
+    # Attributes are fixed per decoration, so build them once up front
+    attributes = {
+        "llm.backend": backend_name,
+        "llm.model": model,
+    }
+    if agent_id:
+        attributes["massgen.agent_id"] = agent_id
+    if round_number is not None:
+        attributes["massgen.round_number"] = round_number
+    span_name = f"llm.call.{backend_name}"
 
     def decorator(func: F) -> F:
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
+            if not _logfire_enabled:
+                return await func(*args, **kwargs)
             tracer = get_tracer()
-            attributes = {
-                "llm.backend": backend_name,
-                "llm.model": model,
-            }
-            if agent_id:
-                attributes["massgen.agent_id"] = agent_id
-            if round_number is not None:
-                attributes["massgen.round_number"] = round_number
-
-            with tracer.span(f"llm.call.{backend_name}", attributes=attributes):
+            with tracer.span(span_name, attributes=attributes):
                 return await func(*args, **kwargs)
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
+            if not _logfire_enabled:
+                return func(*args, **kwargs)
             tracer = get_tracer()
-            attributes = {
-                "llm.backend": backend_name,
-                "llm.model": model,
-            }
-            if agent_id:
-                attributes["massgen.agent_id"] = agent_id
-            if round_number is not None:
-                attributes["massgen.round_number"] = round_number
-
-            with tracer.span(f"llm.call.{backend_name}", attributes=attributes):
+            with tracer.span(span_name, attributes=attributes):
                 return func(*args, **kwargs)
 
         # Return appropriate wrapper based on function type
@@ -552,19 +564,22 @@ def trace_tool_call(
     Returns:
         Decorator function.
     """
+    # Attributes are fixed per decoration, so build them once up front
+    attributes = {
+        "tool.name": tool_name,
+        "tool.type": tool_type,
+    }
+    if agent_id:
+        attributes["massgen.agent_id"] = agent_id
+    span_name = f"tool.{tool_name}"
 
     def decorator(func: F) -> F:
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
+            if not _logfire_enabled:
+                return await func(*args, **kwargs)
             tracer = get_tracer()
-            attributes = {
-                "tool.name": tool_name,
-                "tool.type": tool_type,
-            }
-            if agent_id:
-                attributes["massgen.agent_id"] = agent_id
-
-            with tracer.span(f"tool.{tool_name}", attributes=attributes) as span:
+            with tracer.span(span_name, attributes=attributes) as span:
                 try:
                     result = await func(*args, **kwargs)
                     span.set_attribute("tool.success", True)
@@ -576,15 +591,10 @@ def trace_tool_call(
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
+            if not _logfire_enabled:
+                return func(*args, **kwargs)
             tracer = get_tracer()
-            attributes = {
-                "tool.name": tool_name,
-                "tool.type": tool_type,
-            }
-            if agent_id:
-                attributes["massgen.agent_id"] = agent_id
-
-            with tracer.span(f"tool.{tool_name}", attributes=attributes) as span:
+            with tracer.span(span_name, attributes=attributes) as span:
                 try:
                     result = func(*args, **kwargs)
                     span.set_attribute("tool.success", True)
@@ -622,6 +632,10 @@ def trace_orchestrator_operation(
     Yields:
         Span object for adding additional attributes.
     """
+    if not _logfire_enabled:
+        yield _NOOP_SPAN
+        return
+
     tracer = get_tracer()
     attributes = {
         "massgen.operation": operation,
@@ -660,6 +674,10 @@ def trace_agent_execution(
     Yields:
         Span object for adding additional attributes.
     """
+    if not _logfire_enabled:
+        yield _NOOP_SPAN
+        return
+
     tracer = get_tracer()
     attributes = {
         "massgen.agent_id": agent_id,
@@ -698,6 +716,11 @@ def log_token_usage(
         estimated_cost: Estimated cost in USD.
         model: Model name (optional).
     """
+    if not _logfire_enabled:
+        # Same loguru fallback TracerProxy uses, without building the attributes
+        logger.info("Token usage recorded")
+        return
+
     tracer = get_tracer()
     tracer.info(
         "Token usage recorded",
@@ -748,6 +771,13 @@ def log_tool_execution(
         round_type: Type of round (initial_answer, voting, presentation).
         error_context: Additional error context for debugging (MAS-199).
     """
+    if not _logfire_enabled:
+        if success:
+            logger.info(f"Tool execution: {tool_name}")
+        else:
+            logger.warning(f"Tool execution: {tool_name}")
+        return
+
     tracer = get_tracer()
     log_func = tracer.info if success else tracer.warning
 
@@ -839,6 +869,10 @@ def log_coordination_event(
         agent_id: ID of the agent involved (if applicable).
         details: Additional details about the event.
     """
+    if not _logfire_enabled:
+        logger.info(f"Coordination event: {event_type}")
+        return
+
     tracer = get_tracer()
     tracer.info(
         f"Coordination event: {event_type}",
@@ -934,6 +968,10 @@ def trace_coordination_session(
     """
     global _current_coordination_span
 
+    if not _logfire_enabled:
+        yield _NOOP_SPAN
+        return
+
     tracer = get_tracer()
     attributes = {
         "massgen.task": task[:500] if task else "",
@@ -982,6 +1020,10 @@ def trace_coordination_iteration(
     """
     global _current_iteration_span
 
+    if not _logfire_enabled:
+        yield _NOOP_SPAN
+        return
+
     tracer = get_tracer()
     attributes = {
         "massgen.iteration": iteration,
@@ -1025,6 +1067,10 @@ def trace_agent_round(
     Yields:
         Span object for adding additional attributes.
     """
+    if not _logfire_enabled:
+        yield _NOOP_SPAN
+        return
+
     tracer = get_tracer()
     attributes = {
         "massgen.agent_id": agent_id,
@@ -1131,6 +1177,10 @@ def log_agent_answer(
         answer_preview: First 200 chars of the answer (optional).
         answer_path: Path to the agent's answer file (MAS-199).
     """
+    if not _logfire_enabled:
+        logger.info(f"Agent answer: {answer_label}")
+        return
+
     tracer = get_tracer()
     tracer.info(
         f"Agent answer: {answer_label}",
@@ -1217,6 +1267,10 @@ def log_agent_vote(
         agents_with_answers: Count of agents who submitted answers (MAS-199).
         answer_label_mapping: Map of labels to agent IDs (MAS-199).
     """
+    if not _logfire_enabled:
+        logger.info(f"Agent vote: {agent_id} -> {voted_for_label}")
+        return
+
     tracer = get_tracer()
 
     # Use extended vote reason length (500 chars instead of 200)
@@ -1266,6 +1320,10 @@ def log_winner_selected(
         vote_counts: Dictionary of answer labels to vote counts.
         total_iterations: Total number of iterations completed.
     """
+    if not _logfire_enabled:
+        logger.info(f"Winner selected: {winner_label}")
+        return
+
     tracer = get_tracer()
     tracer.info(
         f"Winner selected: {winner_label}",
@@ -1290,6 +1348,10 @@ def log_final_answer(
         iteration: Final iteration number.
         answer_preview: First 200 chars of the final answer.
     """
+    if not _logfire_enabled:
+        logger.info(f"Final answer from {agent_id}")
+        return
+
     tracer = get_tracer()
     tracer.info(
         f"Final answer from {agent_id}",
@@ -1315,6 +1377,10 @@ def log_iteration_end(
         votes_cast: Number of votes cast in this iteration.
         answers_provided: Number of new answers provided in this iteration.
     """
+    if not _logfire_enabled:
+        logger.info(f"Iteration {iteration} ended: {end_reason}")
+        return
+
     tracer = get_tracer()
     tracer.info(
         f"Iteration {iteration} ended: {end_reason}",
@@ -1356,6 +1422,10 @@ def trace_llm_api_call(
         with trace_llm_api_call("agent_1", "anthropic", "claude-3-opus"):
             stream = await client.messages.create(**params)
     """
+    if not _logfire_enabled:
+        yield _NOOP_SPAN
+        return
+
     tracer = get_tracer()
     attributes = {
         "massgen.agent_id": agent_id,
@@ -1410,6 +1480,10 @@ def trace_subagent_execution(
             result = await execute_subagent(...)
             span.set_attribute("subagent.success", result.success)
     """
+    if not _logfire_enabled:
+        yield _NOOP_SPAN
+        return
+
     tracer = get_tracer()
 
     # Use extended task preview (500 chars instead of 200)
@@ -1592,6 +1666,10 @@ def trace_persona_generation(
         with trace_persona_generation(3, "cognitive_diversity"):
             personas = await generate_personas(...)
     """
+    if not _logfire_enabled:
+        yield _NOOP_SPAN
+        return
+
     tracer = get_tracer()
 
     attributes = {
@@ -8,17 +8,19 @@ Manages the lifecycle of subagents: creation, workspace setup, execution, and re
 import asyncio
 import json
 import logging
+import os
 import shutil
+import stat
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
-
-if TYPE_CHECKING:
-    from massgen.events import MassGenEvent
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import yaml
 
+from massgen.context.task_context import load_task_context_with_warning
+from massgen.events import MassGenEvent
 from massgen.structured_logging import (
     log_subagent_complete,
     log_subagent_spawn,
@@ -38,6 +40,62 @@ from massgen.subagent.models import (
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent file copies when populating a subagent workspace
+CONTEXT_COPY_CONCURRENCY = 8
+
+
+# Static parts of the subagent system prompt; only the task context and task vary
+_SUBAGENT_PROMPT_HEADER = """## Subagent Context
+
+You are a subagent spawned to work on a specific task. Your workspace is isolated and independent.
+"""
+_SUBAGENT_PROMPT_BODY = """
+**Important:**
+- Focus only on the task you were given
+- Create any necessary files in your workspace
+- You cannot spawn additional subagents
+- Do not ask the human or request human input; subagents cannot broadcast to humans
+
+**Output Requirements:**
+- In your final answer, clearly list all files you want the parent agent to see along with their FULL ABSOLUTE PATHS. You can also list directories if needed.
+- You should NOT list every single file as the parent agent does not need to know every file you created -- this context isolation is a main feature of subagents.
+- The parent agent will copy files from your workspace based on your answer
+- Format file paths clearly, e.g.: "Files created: /path/to/file1.md, /path/to/file2.py"
+
+**Your Task:**
+"""
+
+
+def _non_overlapping_batches(rel_paths: List[str]) -> List[List[str]]:
+    """Group relative paths into batches that never share a destination.
+
+    A path lands in a later batch than every earlier path that contains it,
+    lies inside it, or names the same location (e.g. "docs" and "docs/spec.md",
+    or "docs" and "./docs"), so the entries of one batch can be copied
+    concurrently while overlapping entries keep their list order.
+    """
+    parts = [Path(rel_path).parts for rel_path in rel_paths]
+    batches: List[List[str]] = []
+    depths: List[int] = []
+    for i, (rel_path, own) in enumerate(zip(rel_paths, parts)):
+        depth = 0
+        for j, other in enumerate(parts[:i]):
+            if own[: len(other)] == other or other[: len(own)] == own:
+                depth = max(depth, depths[j] + 1)
+        depths.append(depth)
+        if depth == len(batches):
+            batches.append([])
+        batches[depth].append(rel_path)
+    return batches
+
+
+def _read_text_if_exists(path: Path) -> Optional[str]:
+    """Read a text file, returning None if it is missing (one open instead of exists() + read)."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
 
 class SubagentManager:
     """
@@ -53,6 +111,8 @@ class SubagentManager:
     Subagents cannot spawn their own subagents (no nesting).
     """
 
+    _io_executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(
         self,
         parent_workspace: str,
@@ -132,6 +192,10 @@ class SubagentManager:
         self._semaphore = asyncio.Semaphore(max_concurrent)
         # Callbacks to invoke when background subagents complete
         self._completion_callbacks: List[Callable[[str, SubagentResult], None]] = []
+        # Workspace file counts for finished subagents (see get_subagent_display_data)
+        self._workspace_file_counts: Dict[str, tuple[SubagentState, int]] = {}
+        # Running continuations per subagent ID; their workspaces are still changing
+        self._continuations_in_flight: Dict[str, int] = {}
 
         logger.info(
             f"[SubagentManager] Initialized for parent {parent_agent_id}, "
@@ -139,6 +203,20 @@ class SubagentManager:
             f"timeout: {default_timeout}s (min: {min_timeout}s, max: {max_timeout}s)" + (f", log_dir: {self._subagent_logs_base}" if self._subagent_logs_base else ""),
         )
 
+    @classmethod
+    def _get_io_executor(cls) -> ThreadPoolExecutor:
+        """Return the pool shared by all managers for blocking workspace file I/O."""
+        if cls._io_executor is None:
+            cls._io_executor = ThreadPoolExecutor(
+                max_workers=max(4, min(32, (os.cpu_count() or 1) * 2)),
+                thread_name_prefix="massgen-subagent-io",
+            )
+        return cls._io_executor
+
+    async def _run_io(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking file I/O on the shared subagent I/O pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._get_io_executor(), func, *args)
+
     def _clamp_timeout(self, timeout: Optional[int]) -> int:
         """
         Clamp timeout to configured min/max range.
@@ -410,6 +488,57 @@ class SubagentManager:
         registry_file.write_text(json.dumps(registry, indent=2))
         logger.debug(f"[SubagentManager] Saved subagent {subagent_id} to registry")
 
+    def _copy_context_md(self, subagent_id: str, workspace: Path) -> bool:
+        """Copy the parent's CONTEXT.md into the subagent workspace if it exists."""
+        context_md = self.parent_workspace / "CONTEXT.md"
+        if not context_md.is_file():
+            return False
+        try:
+            shutil.copyfile(context_md, workspace / "CONTEXT.md")
+            logger.info(f"[SubagentManager] Auto-copied CONTEXT.md for {subagent_id}")
+            return True
+        except Exception as e:
+            logger.warning(f"[SubagentManager] Failed to copy CONTEXT.md: {e}")
+            return False
+
+    def _copy_context_entry(self, rel_path: str, workspace: Path, created_dirs: Optional[set[Path]] = None) -> bool:
+        """Copy one context file or directory, preserving its relative path.
+
+        ``created_dirs`` is shared across one copy batch so each destination
+        parent directory is created at most once.
+        """
+        src = self.parent_workspace / rel_path
+        # One stat instead of separate exists()/is_file()/is_dir() calls
+        try:
+            mode = os.stat(src).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            logger.warning(f"[SubagentManager] Context file not found: {src}")
+            return False
+
+        # Preserve directory structure
+        dst = workspace / rel_path
+        if created_dirs is None or dst.parent not in created_dirs:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if created_dirs is not None:
+                created_dirs.add(dst.parent)
+
+        # Context files are fresh working copies, so timestamps and xattrs are not
+        # preserved (copy2); shutil.copy keeps only the mode so scripts stay executable
+        if stat.S_ISREG(mode):
+            shutil.copy(src, dst)
+            return True
+        if stat.S_ISDIR(mode):
+            shutil.copytree(
+                src,
+                dst,
+                dirs_exist_ok=True,
+                symlinks=True,
+                ignore_dangling_symlinks=True,
+                copy_function=shutil.copy,
+            )
+            return True
+        return False
+
     def _copy_context_files(
         self,
         subagent_id: str,
@@ -430,41 +559,48 @@ class SubagentManager:
         Returns:
             List of successfully copied files
         """
-        copied = []
+        copied = ["CONTEXT.md"] if self._copy_context_md(subagent_id, workspace) else []
+        created_dirs = {workspace}
+        copied.extend(rel_path for rel_path in context_files if self._copy_context_entry(rel_path, workspace, created_dirs))
 
-        # Auto-copy CONTEXT.md if it exists (for task context)
-        context_md = self.parent_workspace / "CONTEXT.md"
-        if context_md.exists() and context_md.is_file():
-            dst = workspace / "CONTEXT.md"
-            try:
-                shutil.copy2(context_md, dst)
-                copied.append("CONTEXT.md")
-                logger.info(f"[SubagentManager] Auto-copied CONTEXT.md for {subagent_id}")
-            except Exception as e:
-                logger.warning(f"[SubagentManager] Failed to copy CONTEXT.md: {e}")
+        logger.info(f"[SubagentManager] Copied {len(copied)} context files for {subagent_id}")
+        return copied
 
-        for rel_path in context_files:
-            src = self.parent_workspace / rel_path
-            if not src.exists():
-                logger.warning(f"[SubagentManager] Context file not found: {src}")
-                continue
+    async def _copy_context_files_async(
+        self,
+        subagent_id: str,
+        context_files: List[str],
+        workspace: Path,
+    ) -> List[str]:
+        """
+        Async variant of _copy_context_files for use inside the event loop.
 
-            # Preserve directory structure
-            dst = workspace / rel_path
-            dst.parent.mkdir(parents=True, exist_ok=True)
+        Each copy runs on the shared I/O pool so blocking file I/O does not stall
+        other subagents or streaming; copies overlap, bounded by
+        CONTEXT_COPY_CONCURRENCY to limit open file descriptors.
 
-            if src.is_file():
-                shutil.copy2(src, dst)
-                copied.append(rel_path)
-            elif src.is_dir():
-                shutil.copytree(
-                    src,
-                    dst,
-                    dirs_exist_ok=True,
-                    symlinks=True,
-                    ignore_dangling_symlinks=True,
-                )
-                copied.append(rel_path)
+        Returns:
+            List of successfully copied files, in the same order as the sync variant
+        """
+        semaphore = asyncio.Semaphore(CONTEXT_COPY_CONCURRENCY)
+
+        async def run(func: Callable[..., bool], *args: Any) -> bool:
+            async with semaphore:
+                return await self._run_io(func, *args)
+
+        # The auto-copied CONTEXT.md may also be listed explicitly, so it goes first
+        copied = ["CONTEXT.md"] if await self._run_io(self._copy_context_md, subagent_id, workspace) else []
+
+        # Entries that overlap (a directory and a file inside it, or the same path
+        # spelled twice) run in separate batches, in list order, as the sync copy does
+        unique_files = list(dict.fromkeys(context_files))
+        # Set updates are atomic under the GIL; a racing duplicate mkdir is harmless
+        created_dirs = {workspace}
+        entry_copied: Dict[str, bool] = {}
+        for batch in _non_overlapping_batches(unique_files):
+            results = await asyncio.gather(*(run(self._copy_context_entry, rel_path, workspace, created_dirs) for rel_path in batch))
+            entry_copied.update(zip(batch, results))
+        copied.extend(rel_path for rel_path in unique_files if entry_copied[rel_path])
 
         logger.info(f"[SubagentManager] Copied {len(copied)} context files for {subagent_id}")
         return copied
@@ -497,8 +633,6 @@ class SubagentManager:
 
         # Try to read CONTEXT.md from workspace using shared utility
         if workspace:
-            from massgen.context.task_context import load_task_context_with_warning
-
             task_context, context_warning = load_task_context_with_warning(str(workspace))
 
         # CONTEXT.md is required for subagents
@@ -517,27 +651,10 @@ class SubagentManager:
 
 """
 
-        subagent_prompt = f"""## Subagent Context
-
-You are a subagent spawned to work on a specific task. Your workspace is isolated and independent.
-{context_section}
-**Important:**
-- Focus only on the task you were given
-- Create any necessary files in your workspace
-- You cannot spawn additional subagents
-- Do not ask the human or request human input; subagents cannot broadcast to humans
-
-**Output Requirements:**
-- In your final answer, clearly list all files you want the parent agent to see along with their FULL ABSOLUTE PATHS. You can also list directories if needed.
-- You should NOT list every single file as the parent agent does not need to know every file you created -- this context isolation is a main feature of subagents.
-- The parent agent will copy files from your workspace based on your answer
-- Format file paths clearly, e.g.: "Files created: /path/to/file1.md, /path/to/file2.py"
-
-**Your Task:**
-{config.task}
-"""
+        parts = [_SUBAGENT_PROMPT_HEADER, context_section, _SUBAGENT_PROMPT_BODY, config.task, "\n"]
         if base_prompt:
-            subagent_prompt = f"{base_prompt}\n\n{subagent_prompt}"
+            parts[:0] = (base_prompt, "\n\n")
+        subagent_prompt = "".join(parts)
 
         return subagent_prompt, context_warning
 
@@ -559,8 +676,6 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         start_time = time.time()
 
         # Capture context warning early so it's available for all error paths
-        from massgen.context.task_context import load_task_context_with_warning
-
         _, context_warning = load_task_context_with_warning(str(workspace))
 
         try:
@@ -712,8 +827,9 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
             if process.returncode == 0:
                 # Read answer from the output file
-                if answer_file.exists():
-                    answer = answer_file.read_text().strip()
+                answer_text = await self._run_io(_read_text_if_exists, answer_file)
+                if answer_text is not None:
+                    answer = answer_text.strip()
                 else:
                     # Fallback to stdout if file wasn't created
                     answer = stdout.decode() if stdout else ""
@@ -842,15 +958,13 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         Returns:
             SubagentResult with execution outcome
         """
-        from massgen.events import MassGenEvent
-
         start_time = time.time()
 
         # Create workspace
-        workspace = self._create_workspace(config.id)
+        workspace = await self._run_io(self._create_workspace, config.id)
 
         # Copy context files
-        self._copy_context_files(config.id, config.context_files or [], workspace)
+        await self._copy_context_files_async(config.id, config.context_files or [], workspace)
 
         # Verify CONTEXT.md exists (required for subagents)
         context_md = workspace / "CONTEXT.md"
@@ -864,8 +978,6 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
             )
 
         # Load context warning for the result
-        from massgen.context.task_context import load_task_context_with_warning
-
         _, context_warning = load_task_context_with_warning(str(workspace))
 
         # Track state
@@ -986,8 +1098,9 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
             if process.returncode == 0:
                 # Read answer from the output file
-                if answer_file.exists():
-                    answer = answer_file.read_text().strip()
+                answer_text = await self._run_io(_read_text_if_exists, answer_file)
+                if answer_text is not None:
+                    answer = answer_text.strip()
                 else:
                     answer = ""
 
@@ -1478,10 +1591,10 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         )
 
         # Create workspace
-        workspace = self._create_workspace(config.id)
+        workspace = await self._run_io(self._create_workspace, config.id)
 
         # Copy context files (always called to auto-copy CONTEXT.md even if no explicit context_files)
-        self._copy_context_files(config.id, config.context_files or [], workspace)
+        await self._copy_context_files_async(config.id, config.context_files or [], workspace)
 
         # Verify CONTEXT.md exists (required for subagents)
         context_md = workspace / "CONTEXT.md"
@@ -1524,10 +1637,6 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
                     # Attempt to recover completed work from workspace
                     log_dir = self._get_subagent_log_dir(config.id)
                     # Load context warning for the result
-                    from massgen.context.task_context import (
-                        load_task_context_with_warning,
-                    )
-
                     _, context_warning = load_task_context_with_warning(str(workspace))
                     result = self._create_timeout_result_with_recovery(
                         subagent_id=config.id,
@@ -1605,36 +1714,51 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         """
         logger.info(f"[SubagentManager] Spawning {len(tasks)} subagents in parallel")
 
-        # Create coroutines for each task
-        coroutines = []
-        for task_config in tasks:
-            coro = self.spawn_subagent(
-                task=task_config["task"],
-                subagent_id=task_config.get("subagent_id"),
-                model=task_config.get("model"),
-                timeout_seconds=timeout_seconds or task_config.get("timeout_seconds"),
-                context_files=task_config.get("context_files"),
-                system_prompt=task_config.get("system_prompt"),
-                refine=refine,
+        def start(index: int) -> asyncio.Task:
+            task_config = tasks[index]
+            task = asyncio.create_task(
+                self.spawn_subagent(
+                    task=task_config["task"],
+                    subagent_id=task_config.get("subagent_id"),
+                    model=task_config.get("model"),
+                    timeout_seconds=timeout_seconds or task_config.get("timeout_seconds"),
+                    context_files=task_config.get("context_files"),
+                    system_prompt=task_config.get("system_prompt"),
+                    refine=refine,
+                ),
             )
-            coroutines.append(coro)
-
-        # Execute all in parallel (semaphore limits concurrency)
-        results = await asyncio.gather(*coroutines, return_exceptions=True)
-
-        # Convert exceptions to error results
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                task_id = tasks[i].get("subagent_id", f"sub_{i}")
-                final_results.append(
-                    SubagentResult.create_error(
-                        subagent_id=task_id,
-                        error=str(result),
-                    ),
-                )
-            else:
-                final_results.append(result)
+            task_indices[task] = index
+            return task
+
+        # Keep a bounded window of tasks in flight rather than creating one per
+        # input up front. The window is larger than the semaphore so the next
+        # workspace is prepared while earlier subagents are still running.
+        max_in_flight = max(1, self.max_concurrent * 2)
+        final_results: List[Optional[SubagentResult]] = [None] * len(tasks)
+        task_indices: Dict[asyncio.Task, int] = {}
+        next_index = 0
+        pending: set[asyncio.Task] = set()
+        try:
+            while pending or next_index < len(tasks):
+                while next_index < len(tasks) and len(pending) < max_in_flight:
+                    pending.add(start(next_index))
+                    next_index += 1
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    i = task_indices.pop(finished)
+                    try:
+                        final_results[i] = finished.result()
+                    except (Exception, asyncio.CancelledError) as e:
+                        # Convert exceptions to error results
+                        final_results[i] = SubagentResult.create_error(
+                            subagent_id=tasks[i].get("subagent_id", f"sub_{i}"),
+                            error=str(e),
+                        )
+        finally:
+            # Don't leave spawned subagents running if the caller is cancelled
+            for task in pending:
+                task.cancel()
 
         return final_results
 
@@ -1744,10 +1868,6 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
                     # Attempt to recover completed work from workspace
                     log_dir = self._get_subagent_log_dir(config.id)
                     # Load context warning for the result
-                    from massgen.context.task_context import (
-                        load_task_context_with_warning,
-                    )
-
                     _, context_warning = load_task_context_with_warning(str(workspace))
                     result = self._create_timeout_result_with_recovery(
                         subagent_id=config.id,
@@ -1758,10 +1878,6 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
                     )
                 except Exception as e:
                     # Load context warning for the result
-                    from massgen.context.task_context import (
-                        load_task_context_with_warning,
-                    )
-
                     _, context_warning = load_task_context_with_warning(str(workspace))
                     result = SubagentResult.create_error(
                         subagent_id=config.id,
@@ -1850,6 +1966,25 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         Returns:
             SubagentResult with execution outcome
         """
+        # Continuation writes new files into the existing workspace, so its file
+        # count is not cached until the continuation has ended (on any path)
+        self._workspace_file_counts.pop(subagent_id, None)
+        self._continuations_in_flight[subagent_id] = self._continuations_in_flight.get(subagent_id, 0) + 1
+        try:
+            return await self._continue_subagent(subagent_id, new_message, timeout_seconds)
+        finally:
+            remaining = self._continuations_in_flight.pop(subagent_id) - 1
+            if remaining:
+                self._continuations_in_flight[subagent_id] = remaining
+            self._workspace_file_counts.pop(subagent_id, None)
+
+    async def _continue_subagent(
+        self,
+        subagent_id: str,
+        new_message: str,
+        timeout_seconds: Optional[int],
+    ) -> SubagentResult:
+        """Run a continuation for continue_subagent."""
         start_time = time.time()
 
         # Load registry to find the subagent
@@ -1986,8 +2121,9 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
             if process.returncode == 0:
                 # Read answer from the output file
-                if answer_file.exists():
-                    answer = answer_file.read_text().strip()
+                answer_text = await self._run_io(_read_text_if_exists, answer_file)
+                if answer_text is not None:
+                    answer = answer_text.strip()
                 else:
                     # Fallback to stdout if file wasn't created
                     answer = stdout.decode() if stdout else ""
@@ -2123,14 +2259,21 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         elif status == "partial":
             status = "error"
 
-        # Count workspace files
+        # Count workspace files (a finished subagent's workspace no longer changes
+        # unless it is being continued, so its count is walked once and reused on later polls)
         workspace_file_count = 0
         workspace_path = Path(state.workspace_path) if state.workspace_path else None
-        if workspace_path and workspace_path.exists():
-            try:
-                workspace_file_count = sum(1 for p in workspace_path.rglob("*") if p.is_file())
-            except (OSError, IOError):
-                pass
+        if workspace_path:
+            cached = self._workspace_file_counts.get(subagent_id)
+            # Keyed on the state object so a respawn under the same ID is recounted
+            if cached is not None and cached[0] is state:
+                workspace_file_count = cached[1]
+            else:
+                # os.walk classifies entries from scandir, avoiding a Path object and
+                # stat call per file; a missing workspace simply yields nothing
+                workspace_file_count = sum(len(filenames) for _, _, filenames in os.walk(workspace_path))
+                if state.status not in ("pending", "running") and subagent_id not in self._continuations_in_flight:
+                    self._workspace_file_counts[subagent_id] = (state, workspace_file_count)
 
         # Get last log line
         last_log_line = ""
@@ -2375,7 +2518,6 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         # Update with currently tracked subagents (in-memory state takes precedence)
         for subagent_id, state in self._subagents.items():
-            task_preview = state.config.task[:100] + ("..." if len(state.config.task) > 100 else "")
             current_entry = subagents.get(subagent_id, {})
             current_entry.update(
                 {
@@ -2383,7 +2525,7 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
                     "status": state.status,
                     "workspace": state.workspace_path,
                     "started_at": state.started_at.isoformat() if state.started_at else None,
-                    "task": task_preview,
+                    "task": state.task_preview,
                     "session_id": self._subagent_sessions.get(subagent_id, current_entry.get("session_id")),
                     "continuable": bool(self._subagent_sessions.get(subagent_id, current_entry.get("session_id"))),
                     "source_agent": self.parent_agent_id,
@@ -2492,14 +2634,19 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
             return False
 
         if remove_workspace:
-            workspace_dir = self.subagents_base / subagent_id
-            if workspace_dir.exists():
-                shutil.rmtree(workspace_dir)
-                logger.info(f"[SubagentManager] Removed workspace for {subagent_id}")
+            self._remove_workspace(subagent_id)
 
         del self._subagents[subagent_id]
+        self._workspace_file_counts.pop(subagent_id, None)
         return True
 
+    def _remove_workspace(self, subagent_id: str) -> None:
+        """Delete a subagent's directory tree if it exists."""
+        workspace_dir = self.subagents_base / subagent_id
+        if workspace_dir.exists():
+            shutil.rmtree(workspace_dir)
+            logger.info(f"[SubagentManager] Removed workspace for {subagent_id}")
+
     async def cancel_all_subagents(self) -> int:
         """
         Cancel all running subagent processes gracefully.
@@ -2547,6 +2694,13 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
         Returns:
             Number of subagents cleaned up
         """
+        if remove_workspaces:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop to block: remove the workspace trees concurrently
+                return asyncio.run(self.cleanup_all_async(remove_workspaces=True))
+
         count = len(self._subagents)
         subagent_ids = list(self._subagents.keys())
 
@@ -2555,6 +2709,36 @@ You are a subagent spawned to work on a specific task. Your workspace is isolate
 
         return count
 
+    async def cleanup_all_async(self, remove_workspaces: bool = False) -> int:
+        """
+        Clean up all subagents without blocking the event loop.
+
+        Workspace trees are removed concurrently on the shared I/O pool
+        instead of one rmtree after another. A failed removal is logged and
+        does not stop the others; every subagent is untracked either way.
+
+        Args:
+            remove_workspaces: If True, also remove workspace directories
+
+        Returns:
+            Number of subagents cleaned up
+        """
+        subagent_ids = list(self._subagents.keys())
+
+        if remove_workspaces:
+            results = await asyncio.gather(
+                *(self._run_io(self._remove_workspace, subagent_id) for subagent_id in subagent_ids),
+                return_exceptions=True,
+            )
+            for subagent_id, result in zip(subagent_ids, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"[SubagentManager] Failed to remove workspace for {subagent_id}: {result}")
+
+        for subagent_id in subagent_ids:
+            self.cleanup_subagent(subagent_id)
+
+        return len(subagent_ids)
+
     # =========================================================================
     # Timeout Recovery Methods
     # =========================================================================
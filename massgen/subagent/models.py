@@ -9,6 +9,7 @@ import json
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
@@ -554,6 +555,12 @@ class SubagentState:
     finished_at: Optional[datetime] = None
     result: Optional[SubagentResult] = None
 
+    @cached_property
+    def task_preview(self) -> str:
+        """Task truncated to 100 characters for listings (computed once; the task never changes)."""
+        task = self.config.task
+        return task[:100] + ("..." if len(task) > 100 else "")
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert state to dictionary."""
         return {
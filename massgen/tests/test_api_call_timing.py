@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for LLM API call timing on the backend base class.
+
+Run with: uv run pytest massgen/tests/test_api_call_timing.py -v
+"""
+
+import time
+
+import pytest
+
+from massgen.backend.base import LLMBackend
+from massgen.token_manager import APICallMetric
+
+
+class _TimingBackend(LLMBackend):
+    """Minimal concrete backend for exercising the timing helpers."""
+
+    async def stream_with_tools(self, messages, tools, **kwargs):
+        yield  # pragma: no cover
+
+    def get_provider_name(self) -> str:
+        return "Test"
+
+
+class _FakeClocks:
+    """Independently settable wall and monotonic clocks."""
+
+    def __init__(self, wall: float, mono_ns: int):
+        self.wall = wall
+        self.mono_ns = mono_ns
+
+    def time(self) -> float:
+        return self.wall
+
+    def monotonic_ns(self) -> int:
+        return self.mono_ns
+
+
+@pytest.fixture
+def clocks(monkeypatch):
+    fake = _FakeClocks(wall=1_000.0, mono_ns=5_000_000_000)
+    monkeypatch.setattr(time, "time", fake.time)
+    monkeypatch.setattr(time, "monotonic_ns", fake.monotonic_ns)
+    return fake
+
+
+class TestApiCallTiming:
+    """Tests for start_api_call_timing, record_first_token and end_api_call_timing."""
+
+    def test_durations_use_monotonic_clock(self, clocks):
+        """Test that duration and TTFT ignore wall-clock jumps during the call."""
+        backend = _TimingBackend()
+        backend.start_api_call_timing("test-model")
+
+        clocks.mono_ns += 120_000_000
+        clocks.wall -= 3_600.0  # wall clock stepped back mid-call
+        backend.record_first_token()
+
+        clocks.mono_ns += 380_000_000
+        clocks.wall += 7_200.0
+        backend.end_api_call_timing()
+
+        (call,) = backend.get_api_call_history()
+        assert call.time_to_first_token_ms == pytest.approx(120.0)
+        assert call.duration_ms == pytest.approx(500.0)
+        assert call.start_time == 1_000.0
+        assert call.end_time == pytest.approx(call.start_time + call.duration_ms / 1000)
+
+    def test_only_first_token_recorded(self, clocks):
+        """Test that later record_first_token calls keep the first TTFT."""
+        backend = _TimingBackend()
+        backend.start_api_call_timing("test-model")
+
+        clocks.mono_ns += 50_000_000
+        backend.record_first_token()
+        clocks.mono_ns += 200_000_000
+        backend.record_first_token()
+        backend.end_api_call_timing()
+
+        (call,) = backend.get_api_call_history()
+        assert call.time_to_first_token_ms == pytest.approx(50.0)
+        assert call.duration_ms == pytest.approx(250.0)
+
+    def test_metric_without_monotonic_fields_uses_wall_clock(self):
+        """Test that metrics built without monotonic stamps fall back to wall-clock duration."""
+        call = APICallMetric(agent_id="a", round_number=0, call_index=0, backend_name="Test", model="m", start_time=10.0, end_time=10.25)
+
+        assert call.duration_ms == pytest.approx(250.0)
+        assert APICallMetric(agent_id="a", round_number=0, call_index=0, backend_name="Test", model="m", start_time=10.0).duration_ms == 0
@@ -10,11 +10,15 @@ Tests:
 - Built-in hooks (MidStreamInjection, HighPriorityTaskReminder)
 """
 
+import asyncio
+import dataclasses
+import functools
 import json
 from datetime import datetime, timezone
 
 import pytest
 
+import massgen.mcp_tools.hooks as hooks_module
 from massgen.mcp_tools.hooks import (
     GeneralHookManager,
     HighPriorityTaskReminderHook,
@@ -97,6 +101,63 @@ class TestHookEvent:
         assert parsed["tool_name"] == "test"
 
 
+# =============================================================================
+# JSON Handling Tests
+# =============================================================================
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def json_backend(request, monkeypatch):
+    """Run a test with and without orjson-backed parsing."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(hooks_module, "ORJSON_AVAILABLE", True)
+    else:
+        monkeypatch.setattr(hooks_module, "ORJSON_AVAILABLE", False)
+    return request.param
+
+
+class TestJsonHandling:
+    """Tests that hook JSON handling does not depend on orjson being installed."""
+
+    @pytest.mark.asyncio
+    async def test_tool_input_parses_like_stdlib(self, json_backend):
+        """Test that NaN and integers wider than 64 bits parse as json.loads does."""
+        events = []
+
+        def my_hook(event: HookEvent) -> HookResult:
+            events.append(event)
+            return HookResult.allow()
+
+        arguments = '{"big": 123456789012345678901234567890, "nan": NaN, "text": "caf\u00e9"}'
+        await PythonCallableHook("test", my_hook).execute("tool_name", arguments)
+
+        tool_input = events[0].tool_input
+        assert tool_input["big"] == 123456789012345678901234567890
+        assert tool_input["nan"] != tool_input["nan"]
+        assert tool_input["text"] == "café"
+
+    def test_invalid_json_raises_stdlib_error(self, json_backend):
+        """Test that invalid JSON raises json.JSONDecodeError with either backend."""
+        with pytest.raises(json.JSONDecodeError):
+            hooks_module._json_loads("{not json")
+
+    @pytest.mark.asyncio
+    async def test_updated_input_reserialized_with_json_dumps(self, json_backend):
+        """Test that modified arguments keep json.dumps formatting."""
+        updated = {"path": "café.txt", "count": 2}
+
+        def rewrite_hook(event: HookEvent) -> HookResult:
+            return HookResult(updated_input=updated)
+
+        manager = GeneralHookManager()
+        manager.register_global_hook(HookType.PRE_TOOL_USE, PythonCallableHook("rewrite", rewrite_hook))
+
+        result = await manager.execute_hooks(HookType.PRE_TOOL_USE, "tool", '{"path": "a.txt"}', {})
+
+        assert result.modified_args == json.dumps(updated)
+
+
 # =============================================================================
 # HookResult Tests
 # =============================================================================
@@ -189,6 +250,20 @@ class TestPatternHook:
         assert hook.matches("mcp__write_file")
         assert not hook.matches("custom_read_file")
 
+    def test_suffix_match(self):
+        """Test suffix pattern matching with a leading *."""
+
+        class TestHook(PatternHook):
+            async def execute(self, *args, **kwargs):
+                return HookResult.allow()
+
+        hook = TestHook("test", matcher="*update_task_status|mcp__*_file")
+        assert hook.matches("update_task_status")
+        assert hook.matches("mcp__planning__update_task_status")
+        assert hook.matches("mcp__read_file")
+        assert not hook.matches("update_task_status_v2")
+        assert not hook.matches("custom_read_file")
+
     def test_or_pattern(self):
         """Test OR pattern matching with |."""
 
@@ -234,6 +309,43 @@ class TestPythonCallableHook:
         assert result.allowed is False
         assert result.reason == "Test deny"
 
+    @pytest.mark.asyncio
+    async def test_async_callable_object_and_wrapped_coroutine(self):
+        """Test that async __call__ objects and wrapped coroutines are awaited."""
+
+        class AsyncHandler:
+            async def __call__(self, event: HookEvent) -> HookResult:
+                return HookResult.deny(reason="object")
+
+        async def coroutine_hook(event: HookEvent) -> HookResult:
+            return HookResult.deny(reason="wrapped")
+
+        @functools.wraps(coroutine_hook)
+        def wrapper(event):
+            return coroutine_hook(event)
+
+        object_result = await PythonCallableHook("obj", AsyncHandler()).execute("tool_name", "{}")
+        wrapped_result = await PythonCallableHook("wrapped", wrapper).execute("tool_name", "{}")
+
+        assert object_result.reason == "object"
+        assert wrapped_result.reason == "wrapped"
+
+    @pytest.mark.asyncio
+    async def test_sync_wrapper_of_coroutine_runs_in_executor(self):
+        """Test that a sync function wrapping a coroutine function runs off the event loop."""
+
+        async def coroutine_hook(event: HookEvent) -> HookResult:
+            return HookResult.deny(reason="ran in worker")
+
+        @functools.wraps(coroutine_hook)
+        def blocking_wrapper(event):
+            # asyncio.run raises if called from a thread with a running loop
+            return asyncio.run(coroutine_hook(event))
+
+        result = await PythonCallableHook("sync_wrapper", blocking_wrapper, fail_closed=True).execute("tool_name", "{}")
+
+        assert result.reason == "ran in worker"
+
     @pytest.mark.asyncio
     async def test_callable_returning_dict(self):
         """Test with a callable returning dict."""
@@ -245,6 +357,72 @@ class TestPythonCallableHook:
         result = await hook.execute("tool_name", "{}")
         assert result.inject == {"content": "test"}
 
+    @pytest.mark.asyncio
+    async def test_event_tool_input_parsed_from_arguments(self):
+        """Test that the event exposes parsed arguments, falling back to raw text."""
+        events = []
+
+        def my_hook(event: HookEvent) -> HookResult:
+            events.append(event)
+            return HookResult.allow()
+
+        hook = PythonCallableHook("test", my_hook)
+        await hook.execute("tool_name", '{"path": "a.txt"}')
+        await hook.execute("tool_name", "not json")
+        await hook.execute("tool_name", "")
+
+        assert events[0].tool_input == {"path": "a.txt"}
+        assert events[0].to_dict()["tool_input"] == {"path": "a.txt"}
+        assert events[1].tool_input == {"raw": "not json"}
+        assert events[2].tool_input == {}
+
+    @pytest.mark.asyncio
+    async def test_lazily_parsed_event_equals_plain_event(self):
+        """Test that an event with lazily parsed arguments compares equal to a plain HookEvent."""
+        events = []
+
+        def my_hook(event: HookEvent) -> HookResult:
+            events.append(event)
+            return HookResult.allow()
+
+        hook = PythonCallableHook("test", my_hook)
+        await hook.execute("tool_name", '{"a": 1}')
+
+        lazy = events[0]
+        plain = HookEvent(
+            hook_type=lazy.hook_type,
+            session_id=lazy.session_id,
+            orchestrator_id=lazy.orchestrator_id,
+            agent_id=lazy.agent_id,
+            timestamp=lazy.timestamp,
+            tool_name="tool_name",
+            tool_input={"a": 1},
+        )
+        assert lazy == plain
+        assert plain == lazy
+        assert lazy != HookEvent(**{**plain.to_dict(), "timestamp": plain.timestamp, "tool_input": {"a": 2}})
+
+    @pytest.mark.asyncio
+    async def test_lazily_parsed_event_supports_replace(self):
+        """Test that dataclasses.replace works on the event handed to hook callables."""
+        events = []
+
+        def my_hook(event: HookEvent) -> HookResult:
+            events.append(event)
+            return HookResult.allow()
+
+        hook = PythonCallableHook("test", my_hook)
+        await hook.execute("tool_name", '{"a": 1}')
+
+        renamed = dataclasses.replace(events[0], tool_name="other_tool")
+        assert renamed.tool_name == "other_tool"
+        assert renamed.tool_input == {"a": 1}
+        assert renamed == dataclasses.replace(events[0], tool_name="other_tool")
+
+        rewritten = dataclasses.replace(events[0], tool_input={"b": 2})
+        assert rewritten.tool_input == {"b": 2}
+        assert rewritten.to_dict()["tool_input"] == {"b": 2}
+
     @pytest.mark.asyncio
     async def test_pattern_non_match_returns_allow(self):
         """Test that non-matching patterns return allow."""
@@ -444,6 +622,71 @@ class TestGeneralHookManager:
         assert "First" in result.inject["content"]
         assert "Second" in result.inject["content"]
 
+    @pytest.mark.asyncio
+    async def test_execute_hooks_runs_post_hooks_concurrently(self):
+        """Test that PostToolUse hooks overlap but aggregate in registration order."""
+        manager = GeneralHookManager()
+        both_started = asyncio.Event()
+        started = []
+
+        def make_hook(label):
+            async def hook(event):
+                started.append(label)
+                if len(started) == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                return HookResult(inject={"content": label, "strategy": "tool_result"})
+
+            return hook
+
+        manager.register_global_hook(HookType.POST_TOOL_USE, PythonCallableHook("h1", make_hook("First")))
+        manager.register_global_hook(HookType.POST_TOOL_USE, PythonCallableHook("h2", make_hook("Second")))
+
+        result = await manager.execute_hooks(HookType.POST_TOOL_USE, "tool", "{}", {}, tool_output="output")
+
+        assert result.hook_errors == []
+        assert result.inject["content"].index("First") < result.inject["content"].index("Second")
+
+    @pytest.mark.asyncio
+    async def test_execute_hooks_without_hooks_returns_shared_allow(self):
+        """Test that the no-hooks path reuses a single read-only allow result."""
+        manager = GeneralHookManager()
+
+        first = await manager.execute_hooks(HookType.PRE_TOOL_USE, "tool", "{}", {})
+        second = await manager.execute_hooks(HookType.PRE_TOOL_USE, "other", "{}", {})
+
+        assert first is second
+        assert first is HookResult.ALLOW
+        assert first.allowed is True
+        assert first.decision == "allow"
+        with pytest.raises(AttributeError):
+            first.decision = "deny"
+        # The public factory still hands out independent, mutable results
+        assert HookResult.allow() is not first
+
+    @pytest.mark.asyncio
+    async def test_execute_hooks_sees_hooks_registered_after_cached_lookup(self):
+        """Test that registering a hook invalidates cached tool-name lookups."""
+        manager = GeneralHookManager()
+        manager.register_global_hook(
+            HookType.PRE_TOOL_USE,
+            PythonCallableHook("allow", lambda event: HookResult.allow()),
+        )
+
+        result = await manager.execute_hooks(HookType.PRE_TOOL_USE, "tool", "{}", {})
+        assert result.allowed is True
+
+        manager.register_global_hook(
+            HookType.PRE_TOOL_USE,
+            PythonCallableHook("deny", lambda event: HookResult.deny(reason="Blocked")),
+        )
+        result = await manager.execute_hooks(HookType.PRE_TOOL_USE, "tool", "{}", {})
+        assert result.decision == "deny"
+
+        manager.clear_hooks()
+        result = await manager.execute_hooks(HookType.PRE_TOOL_USE, "tool", "{}", {})
+        assert result.allowed is True
+
     def test_register_hooks_from_config(self):
         """Test configuration-based hook registration."""
         manager = GeneralHookManager()
@@ -464,6 +707,17 @@ class TestGeneralHookManager:
         assert len(pre_hooks) == 1
         assert len(post_hooks) == 1
 
+    def test_handler_path_resolves_nested_attributes(self):
+        """Test that handler paths can point at attributes nested below the module."""
+        from massgen.mcp_tools.hooks import _import_callable
+
+        assert _import_callable("massgen.mcp_tools.hooks.HookResult.allow") == HookResult.allow
+        assert _import_callable("json.dumps") is json.dumps
+        with pytest.raises(ModuleNotFoundError):
+            _import_callable("massgen_missing_module.handler")
+        with pytest.raises(AttributeError):
+            _import_callable("massgen.mcp_tools.hooks.HookResult.missing")
+
     @pytest.mark.asyncio
     async def test_deny_with_pattern_only_blocks_matching_tools(self):
         """Test that deny hook with pattern only blocks matching tools."""
@@ -583,6 +837,12 @@ class TestMidStreamInjectionHook:
         assert result.inject["strategy"] == "tool_result"
 
 
+# update_task_status outputs shared by the reminder hook tests
+_HIGH_COMPLETED_OUTPUT = json.dumps({"task": {"priority": "high", "status": "completed"}, "newly_ready_tasks": []})
+_LOW_COMPLETED_OUTPUT = json.dumps({"task": {"priority": "low", "status": "completed"}, "newly_ready_tasks": []})
+_HIGH_IN_PROGRESS_OUTPUT = json.dumps({"task": {"priority": "high", "status": "in_progress"}, "newly_ready_tasks": []})
+
+
 class TestHighPriorityTaskReminderHook:
     """Tests for HighPriorityTaskReminderHook."""
 
@@ -599,12 +859,7 @@ class TestHighPriorityTaskReminderHook:
         """Test hook with non-matching tool name returns allow without checking output."""
         hook = HighPriorityTaskReminderHook()
         # Even with valid high-priority task output, should not inject for wrong tool
-        tool_output = json.dumps(
-            {
-                "task": {"priority": "high", "status": "completed"},
-                "newly_ready_tasks": [],
-            },
-        )
+        tool_output = _HIGH_COMPLETED_OUTPUT
         result = await hook.execute(
             "other_tool",
             "{}",
@@ -623,16 +878,34 @@ class TestHighPriorityTaskReminderHook:
         )
         assert result.inject is None
 
+    @pytest.mark.asyncio
+    async def test_text_mentioning_markers_returns_allow(self):
+        """Test non-JSON text containing the quoted markers is rejected before parsing."""
+        hook = HighPriorityTaskReminderHook()
+        result = await hook.execute(
+            "mcp__planning__update_task_status",
+            "{}",
+            {"tool_output": 'status "completed" with priority "high"'},
+        )
+        assert result.inject is None
+
+    @pytest.mark.asyncio
+    async def test_indented_json_output_still_injects(self):
+        """Test JSON output with leading whitespace is still parsed."""
+        hook = HighPriorityTaskReminderHook()
+        tool_output = "\n  " + _HIGH_COMPLETED_OUTPUT
+        result = await hook.execute(
+            "mcp__planning__update_task_status",
+            "{}",
+            {"tool_output": tool_output},
+        )
+        assert result.inject is not None
+
     @pytest.mark.asyncio
     async def test_low_priority_task_returns_allow(self):
         """Test hook with low-priority completed task returns allow."""
         hook = HighPriorityTaskReminderHook()
-        tool_output = json.dumps(
-            {
-                "task": {"priority": "low", "status": "completed"},
-                "newly_ready_tasks": [],
-            },
-        )
+        tool_output = _LOW_COMPLETED_OUTPUT
         result = await hook.execute(
             "mcp__planning__update_task_status",
             "{}",
@@ -644,12 +917,7 @@ class TestHighPriorityTaskReminderHook:
     async def test_high_priority_incomplete_task_returns_allow(self):
         """Test hook with high-priority but incomplete task returns allow."""
         hook = HighPriorityTaskReminderHook()
-        tool_output = json.dumps(
-            {
-                "task": {"priority": "high", "status": "in_progress"},
-                "newly_ready_tasks": [],
-            },
-        )
+        tool_output = _HIGH_IN_PROGRESS_OUTPUT
         result = await hook.execute(
             "mcp__planning__update_task_status",
             "{}",
@@ -661,12 +929,7 @@ class TestHighPriorityTaskReminderHook:
     async def test_high_priority_completed_task_injects_reminder(self):
         """Test hook injects reminder for high-priority completed task."""
         hook = HighPriorityTaskReminderHook()
-        tool_output = json.dumps(
-            {
-                "task": {"priority": "high", "status": "completed"},
-                "newly_ready_tasks": [],
-            },
-        )
+        tool_output = _HIGH_COMPLETED_OUTPUT
         result = await hook.execute(
             "mcp__planning__update_task_status",
             "{}",
@@ -8,19 +8,41 @@ These tests verify:
 - Context managers and decorators function properly
 """
 
+import dataclasses
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
 import pytest
+from loguru import logger
 
+import massgen.structured_logging as structured_logging
 from massgen.structured_logging import (
     ObservabilityConfig,
     TracerProxy,
     configure_observability,
     get_tracer,
     is_observability_enabled,
+    log_agent_answer,
+    log_agent_vote,
     log_coordination_event,
+    log_final_answer,
+    log_iteration_end,
+    log_persona_generation,
+    log_subagent_complete,
+    log_subagent_spawn,
     log_token_usage,
     log_tool_execution,
+    log_winner_selected,
     trace_agent_execution,
+    trace_agent_round,
+    trace_coordination_iteration,
+    trace_coordination_session,
+    trace_llm_api_call,
+    trace_llm_call,
     trace_orchestrator_operation,
+    trace_persona_generation,
+    trace_subagent_execution,
+    trace_tool_call,
 )
 
 
@@ -36,6 +58,12 @@ class TestTracerProxy:
             span.record_exception(ValueError("test"))
             span.add_event("test_event", {"attr": "value"})
 
+    def test_tracer_proxy_span_reuses_noop_span_when_disabled(self):
+        """Disabled spans should share a single no-op span instance."""
+        tracer = TracerProxy()
+        with tracer.span("first") as first, tracer.span("second") as second:
+            assert first is second
+
     def test_tracer_proxy_info_when_disabled(self):
         """TracerProxy.info() should fall back to loguru when Logfire is disabled."""
         tracer = TracerProxy()
@@ -97,6 +125,12 @@ class TestConfiguration:
         assert config.send_to_logfire is True
         assert config.scrub_sensitive_data is True
 
+    def test_observability_config_is_immutable(self):
+        """ObservabilityConfig is shared via get_config(), so it must not be mutable."""
+        config = ObservabilityConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.enabled = True
+
 
 class TestContextManagers:
     """Tests for tracing context managers."""
@@ -122,6 +156,17 @@ class TestContextManagers:
         ) as span:
             assert span is not None
 
+    def test_context_managers_share_noop_span_when_disabled(self):
+        """Disabled context managers should yield the shared no-op span."""
+        with trace_orchestrator_operation("op") as outer:
+            with trace_agent_execution(
+                agent_id="agent_1",
+                backend_name="openai",
+                model="gpt-4",
+                round_number=1,
+            ) as inner:
+                assert outer is inner
+
 
 class TestEventLoggers:
     """Tests for structured event logging functions."""
@@ -162,6 +207,22 @@ class TestEventLoggers:
             error_message="Tool execution failed",
         )
 
+    def test_log_tool_execution_falls_back_to_loguru_when_disabled(self):
+        """Disabled event loggers should still emit the plain loguru message."""
+        messages = []
+        sink_id = logger.add(lambda m: messages.append((m.record["level"].name, m.record["message"])))
+        try:
+            log_tool_execution(
+                agent_id="agent_1",
+                tool_name="broken_tool",
+                tool_type="mcp",
+                execution_time_ms=5.0,
+                success=False,
+            )
+        finally:
+            logger.remove(sink_id)
+        assert ("WARNING", "Tool execution: broken_tool") in messages
+
     def test_log_coordination_event(self):
         """log_coordination_event should not raise."""
         log_coordination_event(
@@ -180,7 +241,6 @@ class TestDecorators:
 
     def test_trace_llm_call_decorator_sync(self):
         """trace_llm_call decorator should work with sync functions."""
-        from massgen.structured_logging import trace_llm_call
 
         @trace_llm_call(backend_name="openai", model="gpt-4")
         def sync_function():
@@ -192,7 +252,6 @@ class TestDecorators:
     @pytest.mark.asyncio
     async def test_trace_llm_call_decorator_async(self):
         """trace_llm_call decorator should work with async functions."""
-        from massgen.structured_logging import trace_llm_call
 
         @trace_llm_call(backend_name="anthropic", model="claude-3")
         async def async_function():
@@ -203,7 +262,6 @@ class TestDecorators:
 
     def test_trace_tool_call_decorator_sync(self):
         """trace_tool_call decorator should work with sync functions."""
-        from massgen.structured_logging import trace_tool_call
 
         @trace_tool_call(tool_name="test_tool", tool_type="custom")
         def sync_tool():
@@ -215,7 +273,6 @@ class TestDecorators:
     @pytest.mark.asyncio
     async def test_trace_tool_call_decorator_async(self):
         """trace_tool_call decorator should work with async functions."""
-        from massgen.structured_logging import trace_tool_call
 
         @trace_tool_call(tool_name="async_tool", tool_type="mcp")
         async def async_tool():
@@ -224,9 +281,31 @@ class TestDecorators:
         result = await async_tool()
         assert result == {"success": True}
 
+    def test_trace_llm_call_passes_attributes_when_enabled(self, monkeypatch):
+        """trace_llm_call should open a span with its fixed attributes on every call."""
+        calls = []
+
+        @contextmanager
+        def fake_span(name, **attributes):
+            calls.append((name, attributes))
+            yield MagicMock()
+
+        tracer = TracerProxy()
+        tracer._logfire = MagicMock(span=fake_span)
+        monkeypatch.setattr(structured_logging, "_logfire_enabled", True)
+        monkeypatch.setattr(structured_logging, "_tracer", tracer)
+
+        @trace_llm_call(backend_name="openai", model="gpt-4", agent_id="agent_1")
+        def sync_function():
+            return "result"
+
+        assert sync_function() == "result"
+        assert sync_function() == "result"
+        expected = {"llm.backend": "openai", "llm.model": "gpt-4", "massgen.agent_id": "agent_1"}
+        assert calls == [("llm.call.openai", expected), ("llm.call.openai", expected)]
+
     def test_trace_tool_call_handles_exceptions(self):
         """trace_tool_call should record exceptions properly."""
-        from massgen.structured_logging import trace_tool_call
 
         @trace_tool_call(tool_name="failing_tool", tool_type="custom")
         def failing_tool():
@@ -241,8 +320,6 @@ class TestCoordinationTracing:
 
     def test_trace_coordination_session(self):
         """trace_coordination_session context manager should work."""
-        from massgen.structured_logging import trace_coordination_session
-
         with trace_coordination_session(
             task="Test task",
             num_agents=3,
@@ -252,8 +329,6 @@ class TestCoordinationTracing:
 
     def test_trace_coordination_iteration(self):
         """trace_coordination_iteration context manager should work."""
-        from massgen.structured_logging import trace_coordination_iteration
-
         with trace_coordination_iteration(
             iteration=1,
             available_answers=["agent1.1", "agent2.1"],
@@ -262,8 +337,6 @@ class TestCoordinationTracing:
 
     def test_trace_agent_round(self):
         """trace_agent_round context manager should work."""
-        from massgen.structured_logging import trace_agent_round
-
         with trace_agent_round(
             agent_id="agent_a",
             iteration=1,
@@ -274,8 +347,6 @@ class TestCoordinationTracing:
 
     def test_log_agent_answer(self):
         """log_agent_answer should not raise."""
-        from massgen.structured_logging import log_agent_answer
-
         log_agent_answer(
             agent_id="agent_a",
             answer_label="agent1.1",
@@ -286,8 +357,6 @@ class TestCoordinationTracing:
 
     def test_log_agent_vote(self):
         """log_agent_vote should not raise."""
-        from massgen.structured_logging import log_agent_vote
-
         log_agent_vote(
             agent_id="agent_b",
             voted_for_label="agent1.1",
@@ -299,8 +368,6 @@ class TestCoordinationTracing:
 
     def test_log_winner_selected(self):
         """log_winner_selected should not raise."""
-        from massgen.structured_logging import log_winner_selected
-
         log_winner_selected(
             winner_agent_id="agent_a",
             winner_label="agent1.1",
@@ -310,8 +377,6 @@ class TestCoordinationTracing:
 
     def test_log_final_answer(self):
         """log_final_answer should not raise."""
-        from massgen.structured_logging import log_final_answer
-
         log_final_answer(
             agent_id="agent_a",
             iteration=3,
@@ -320,8 +385,6 @@ class TestCoordinationTracing:
 
     def test_log_iteration_end(self):
         """log_iteration_end should not raise."""
-        from massgen.structured_logging import log_iteration_end
-
         log_iteration_end(
             iteration=1,
             end_reason="all_voted",
@@ -331,13 +394,6 @@ class TestCoordinationTracing:
 
     def test_nested_coordination_spans(self):
         """Nested coordination spans should work correctly."""
-        from massgen.structured_logging import (
-            log_agent_answer,
-            log_agent_vote,
-            trace_coordination_iteration,
-            trace_coordination_session,
-        )
-
         with trace_coordination_session(
             task="Nested test",
             num_agents=2,
@@ -370,8 +426,6 @@ class TestLLMAPICallTracing:
 
     def test_trace_llm_api_call_basic(self):
         """trace_llm_api_call should work as a context manager."""
-        from massgen.structured_logging import trace_llm_api_call
-
         with trace_llm_api_call(
             agent_id="agent_1",
             provider="anthropic",
@@ -383,8 +437,6 @@ class TestLLMAPICallTracing:
 
     def test_trace_llm_api_call_with_extra_attributes(self):
         """trace_llm_api_call should accept extra attributes."""
-        from massgen.structured_logging import trace_llm_api_call
-
         with trace_llm_api_call(
             agent_id="agent_2",
             provider="openai",
@@ -397,8 +449,6 @@ class TestLLMAPICallTracing:
 
     def test_trace_llm_api_call_yields_span(self):
         """trace_llm_api_call should yield a span object."""
-        from massgen.structured_logging import trace_llm_api_call
-
         with trace_llm_api_call(
             agent_id="agent_3",
             provider="gemini",
@@ -409,8 +459,6 @@ class TestLLMAPICallTracing:
 
     def test_trace_llm_api_call_handles_exceptions(self):
         """trace_llm_api_call should properly handle exceptions."""
-        from massgen.structured_logging import trace_llm_api_call
-
         try:
             with trace_llm_api_call(
                 agent_id="agent_4",
@@ -427,8 +475,6 @@ class TestSubagentTracing:
 
     def test_trace_subagent_execution_basic(self):
         """trace_subagent_execution should work as a context manager."""
-        from massgen.structured_logging import trace_subagent_execution
-
         with trace_subagent_execution(
             subagent_id="sub_1",
             parent_agent_id="agent_a",
@@ -441,8 +487,6 @@ class TestSubagentTracing:
 
     def test_trace_subagent_execution_yields_span(self):
         """trace_subagent_execution should yield a span for attribute setting."""
-        from massgen.structured_logging import trace_subagent_execution
-
         with trace_subagent_execution(
             subagent_id="sub_2",
             parent_agent_id="agent_b",
@@ -454,8 +498,6 @@ class TestSubagentTracing:
 
     def test_log_subagent_spawn(self):
         """log_subagent_spawn should not raise."""
-        from massgen.structured_logging import log_subagent_spawn
-
         log_subagent_spawn(
             subagent_id="sub_3",
             parent_agent_id="agent_c",
@@ -468,8 +510,6 @@ class TestSubagentTracing:
 
     def test_log_subagent_spawn_minimal(self):
         """log_subagent_spawn should work with minimal args."""
-        from massgen.structured_logging import log_subagent_spawn
-
         log_subagent_spawn(
             subagent_id="sub_4",
             parent_agent_id="agent_d",
@@ -478,8 +518,6 @@ class TestSubagentTracing:
 
     def test_log_subagent_complete_success(self):
         """log_subagent_complete should handle success case."""
-        from massgen.structured_logging import log_subagent_complete
-
         log_subagent_complete(
             subagent_id="sub_5",
             parent_agent_id="agent_e",
@@ -492,8 +530,6 @@ class TestSubagentTracing:
 
     def test_log_subagent_complete_timeout(self):
         """log_subagent_complete should handle timeout case."""
-        from massgen.structured_logging import log_subagent_complete
-
         log_subagent_complete(
             subagent_id="sub_6",
             parent_agent_id="agent_f",
@@ -505,8 +541,6 @@ class TestSubagentTracing:
 
     def test_log_subagent_complete_failure(self):
         """log_subagent_complete should handle failure case."""
-        from massgen.structured_logging import log_subagent_complete
-
         log_subagent_complete(
             subagent_id="sub_7",
             parent_agent_id="agent_g",
@@ -522,8 +556,6 @@ class TestPersonaGenerationTracing:
 
     def test_trace_persona_generation_basic(self):
         """trace_persona_generation should work as a context manager."""
-        from massgen.structured_logging import trace_persona_generation
-
         with trace_persona_generation(
             num_agents=3,
             strategy="cognitive_diversity",
@@ -533,8 +565,6 @@ class TestPersonaGenerationTracing:
 
     def test_trace_persona_generation_yields_span(self):
         """trace_persona_generation should yield a span for attribute setting."""
-        from massgen.structured_logging import trace_persona_generation
-
         with trace_persona_generation(
             num_agents=5,
             strategy="random",
@@ -544,8 +574,6 @@ class TestPersonaGenerationTracing:
 
     def test_log_persona_generation_success(self):
         """log_persona_generation should handle success case."""
-        from massgen.structured_logging import log_persona_generation
-
         log_persona_generation(
             agent_ids=["agent_a", "agent_b", "agent_c"],
             strategy="cognitive_diversity",
@@ -557,8 +585,6 @@ class TestPersonaGenerationTracing:
 
     def test_log_persona_generation_fallback(self):
         """log_persona_generation should handle fallback case."""
-        from massgen.structured_logging import log_persona_generation
-
         log_persona_generation(
             agent_ids=["agent_d", "agent_e"],
             strategy="implementation_diversity",
@@ -571,8 +597,6 @@ class TestPersonaGenerationTracing:
 
     def test_log_persona_generation_minimal(self):
         """log_persona_generation should work with minimal args."""
-        from massgen.structured_logging import log_persona_generation
-
         log_persona_generation(
             agent_ids=["agent_f"],
             strategy="default",
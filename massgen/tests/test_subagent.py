@@ -351,6 +351,14 @@ class TestSubagentState:
         assert data["status"] == "running"
         assert "config" in data
 
+    def test_task_preview_truncates_long_tasks(self):
+        """Test that task_preview truncates to 100 characters with an ellipsis."""
+        short_state = SubagentState(config=SubagentConfig.create(task="Short task", parent_agent_id="parent_1"))
+        long_state = SubagentState(config=SubagentConfig.create(task="x" * 150, parent_agent_id="parent_1"))
+
+        assert short_state.task_preview == "Short task"
+        assert long_state.task_preview == "x" * 100 + "..."
+
 
 class TestSubagentOrchestratorConfig:
     """Tests for SubagentOrchestratorConfig dataclass."""
@@ -9,6 +9,9 @@ Tests for the async subagent execution feature (MAS-214):
 - Multiple callback support
 """
 
+import asyncio
+import threading
+import time
 from typing import List, Tuple
 from unittest.mock import MagicMock
 
@@ -413,6 +416,321 @@ class TestSpawnSubagentBackground:
         assert isinstance(manager._background_tasks, dict)
 
 
+# =============================================================================
+# Parallel Spawn Tests
+# =============================================================================
+
+
+class TestSpawnParallel:
+    """Tests for spawn_parallel fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_spawn_parallel_bounds_in_flight_and_preserves_order(self):
+        """Test that spawn_parallel keeps a bounded window and returns results in input order."""
+        from massgen.subagent.manager import SubagentManager
+
+        manager = SubagentManager(
+            parent_workspace="/tmp/test",
+            parent_agent_id="test-agent",
+            orchestrator_id="test-orch",
+            parent_agent_configs=[],
+            max_concurrent=2,
+        )
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def fake_spawn(task, subagent_id=None, **kwargs):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            # Later tasks finish first to exercise out-of-order completion
+            await asyncio.sleep(0.001 * (10 - int(subagent_id)))
+            in_flight -= 1
+            if subagent_id == "3":
+                raise RuntimeError("boom")
+            return SubagentResult.create_success(
+                subagent_id=subagent_id,
+                answer=task,
+                workspace_path="/tmp",
+                execution_time_seconds=0.0,
+            )
+
+        manager.spawn_subagent = fake_spawn
+        tasks = [{"task": f"task {i}", "subagent_id": str(i)} for i in range(10)]
+
+        results = await manager.spawn_parallel(tasks)
+
+        assert peak_in_flight <= 4
+        assert [r.subagent_id for r in results] == [str(i) for i in range(10)]
+        assert results[3].success is False
+        assert "boom" in results[3].error
+        assert results[9].answer == "task 9"
+
+
+# =============================================================================
+# Context File Copy Tests
+# =============================================================================
+
+
+class TestCopyContextFiles:
+    """Tests for copying parent context files into subagent workspaces."""
+
+    @pytest.mark.asyncio
+    async def test_async_copy_matches_sync_copy(self, tmp_path):
+        """Test that the threaded async copy produces the same files and order as the sync copy."""
+        from massgen.subagent.manager import SubagentManager
+
+        parent = tmp_path / "parent"
+        (parent / "docs").mkdir(parents=True)
+        (parent / "CONTEXT.md").write_text("task context")
+        (parent / "notes.txt").write_text("notes")
+        (parent / "docs" / "spec.md").write_text("spec")
+
+        manager = SubagentManager(
+            parent_workspace=str(parent),
+            parent_agent_id="test-agent",
+            orchestrator_id="test-orch",
+            parent_agent_configs=[],
+        )
+        context_files = ["notes.txt", "missing.txt", "docs"]
+
+        sync_workspace = tmp_path / "sync"
+        async_workspace = tmp_path / "async"
+        sync_workspace.mkdir()
+        async_workspace.mkdir()
+
+        sync_copied = manager._copy_context_files("sub", context_files, sync_workspace)
+        async_copied = await manager._copy_context_files_async("sub", context_files, async_workspace)
+
+        assert async_copied == sync_copied == ["CONTEXT.md", "notes.txt", "docs"]
+        assert (async_workspace / "CONTEXT.md").read_text() == "task context"
+        assert (async_workspace / "docs" / "spec.md").read_text() == "spec"
+
+    @pytest.mark.asyncio
+    async def test_async_copy_never_overlaps_destinations(self, tmp_path):
+        """Test that nested or repeated context paths are never copied concurrently."""
+        from massgen.subagent.manager import SubagentManager
+
+        parent = tmp_path / "parent"
+        (parent / "docs").mkdir(parents=True)
+        (parent / "CONTEXT.md").write_text("task context")
+        (parent / "notes.txt").write_text("notes")
+        (parent / "docs" / "spec.md").write_text("spec")
+
+        manager = SubagentManager(
+            parent_workspace=str(parent),
+            parent_agent_id="test-agent",
+            orchestrator_id="test-orch",
+            parent_agent_configs=[],
+        )
+        lock = threading.Lock()
+        in_flight: List[str] = []
+        overlaps: List[Tuple[str, str]] = []
+
+        def conflicts(a: str, b: str) -> bool:
+            return a == b or a.startswith(b + "/") or b.startswith(a + "/")
+
+        def track(dest, copy, *args):
+            with lock:
+                overlaps.extend((dest, other) for other in in_flight if conflicts(dest, other))
+                in_flight.append(dest)
+            time.sleep(0.02)
+            try:
+                return copy(*args)
+            finally:
+                with lock:
+                    in_flight.remove(dest)
+
+        copy_entry = manager._copy_context_entry
+        copy_context_md = manager._copy_context_md
+        manager._copy_context_entry = lambda rel_path, *args: track(rel_path, copy_entry, rel_path, *args)
+        manager._copy_context_md = lambda subagent_id, workspace: track("CONTEXT.md", copy_context_md, subagent_id, workspace)
+
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        copied = await manager._copy_context_files_async("sub", ["docs/spec.md", "CONTEXT.md", "docs", "notes.txt"], workspace)
+
+        assert overlaps == []
+        assert copied == ["CONTEXT.md", "docs/spec.md", "CONTEXT.md", "docs", "notes.txt"]
+        assert (workspace / "CONTEXT.md").read_text() == "task context"
+        assert (workspace / "docs" / "spec.md").read_text() == "spec"
+
+
+# =============================================================================
+# Display Data Tests
+# =============================================================================
+
+
+class TestSubagentDisplayData:
+    """Tests for get_subagent_display_data."""
+
+    def test_file_count_cached_only_once_finished(self, tmp_path):
+        """Test that workspace files are recounted while running and cached once finished."""
+        from massgen.subagent.manager import SubagentManager
+        from massgen.subagent.models import SubagentConfig, SubagentState
+
+        manager = SubagentManager(
+            parent_workspace=str(tmp_path),
+            parent_agent_id="test-agent",
+            orchestrator_id="test-orch",
+            parent_agent_configs=[],
+        )
+        workspace = manager._create_workspace("sub_a")
+        config = SubagentConfig.create(task="task", parent_agent_id="test-agent", subagent_id="sub_a")
+        state = SubagentState(config=config, status="running", workspace_path=str(workspace))
+        manager._subagents["sub_a"] = state
+
+        (workspace / "one.txt").write_text("1")
+        assert manager.get_subagent_display_data("sub_a").workspace_file_count == 1
+
+        (workspace / "two.txt").write_text("2")
+        state.status = "completed"
+        assert manager.get_subagent_display_data("sub_a").workspace_file_count == 2
+
+        (workspace / "three.txt").write_text("3")
+        assert manager.get_subagent_display_data("sub_a").workspace_file_count == 2
+
+        # A respawn under the same ID gets a fresh count
+        manager._subagents["sub_a"] = SubagentState(config=config, status="completed", workspace_path=str(workspace))
+        assert manager.get_subagent_display_data("sub_a").workspace_file_count == 3
+
+    @pytest.mark.asyncio
+    async def test_file_count_not_cached_during_continuation(self, tmp_path):
+        """Test that files written while a finished subagent is continued are counted."""
+        from massgen.subagent.manager import SubagentManager
+        from massgen.subagent.models import SubagentConfig, SubagentState
+
+        manager = SubagentManager(
+            parent_workspace=str(tmp_path),
+            parent_agent_id="test-agent",
+            orchestrator_id="test-orch",
+            parent_agent_configs=[],
+        )
+        workspace = manager._create_workspace("sub_a")
+        config = SubagentConfig.create(task="task", parent_agent_id="test-agent", subagent_id="sub_a")
+        manager._subagents["sub_a"] = SubagentState(config=config, status="completed", workspace_path=str(workspace))
+
+        (workspace / "a.txt").write_text("a")
+        assert manager.get_subagent_display_data("sub_a").workspace_file_count == 1
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_continue(subagent_id, new_message, timeout_seconds):
+            started.set()
+            await release.wait()
+            (workspace / "answer_continued.txt").write_text("answer")
+            return SubagentResult.create_success(
+                subagent_id=subagent_id,
+                answer="answer",
+                workspace_path=str(workspace),
+                execution_time_seconds=0.0,
+            )
+
+        manager._continue_subagent = fake_continue
+        continuation = asyncio.create_task(manager.continue_subagent("sub_a", "more"))
+        await started.wait()
+
+        # Polls while the continuation runs see its files as they appear
+        assert manager.get_subagent_display_data("sub_a").workspace_file_count == 1
+        (workspace / "b.txt").write_text("b")
+        assert manager.get_subagent_display_data("sub_a").workspace_file_count == 2
+
+        release.set()
+        await continuation
+        assert manager.get_subagent_display_data("sub_a").workspace_file_count == 3
+
+
+# =============================================================================
+# Cleanup Tests
+# =============================================================================
+
+
+class TestCleanupAllAsync:
+    """Tests for cleanup_all_async and the sync cleanup_all wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_cleanup_all_async_removes_workspaces(self, tmp_path):
+        """Test that all tracked subagents are dropped and their workspaces deleted."""
+        from massgen.subagent.manager import SubagentManager
+        from massgen.subagent.models import SubagentConfig, SubagentState
+
+        manager = SubagentManager(
+            parent_workspace=str(tmp_path),
+            parent_agent_id="test-agent",
+            orchestrator_id="test-orch",
+            parent_agent_configs=[],
+        )
+        for subagent_id in ("sub_a", "sub_b"):
+            workspace = manager._create_workspace(subagent_id)
+            (workspace / "out.txt").write_text("data")
+            config = SubagentConfig.create(task="task", parent_agent_id="test-agent", subagent_id=subagent_id)
+            manager._subagents[subagent_id] = SubagentState(config=config, workspace_path=str(workspace))
+
+        count = await manager.cleanup_all_async(remove_workspaces=True)
+
+        assert count == 2
+        assert manager._subagents == {}
+        assert not (manager.subagents_base / "sub_a").exists()
+        assert not (manager.subagents_base / "sub_b").exists()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_all_async_continues_past_failed_removal(self, tmp_path):
+        """Test that one failing workspace removal neither aborts the others nor leaves subagents tracked."""
+        from massgen.subagent.manager import SubagentManager
+        from massgen.subagent.models import SubagentConfig, SubagentState
+
+        manager = SubagentManager(
+            parent_workspace=str(tmp_path),
+            parent_agent_id="test-agent",
+            orchestrator_id="test-orch",
+            parent_agent_configs=[],
+        )
+        for subagent_id in ("sub_a", "sub_b", "sub_c"):
+            workspace = manager._create_workspace(subagent_id)
+            (workspace / "out.txt").write_text("data")
+            config = SubagentConfig.create(task="task", parent_agent_id="test-agent", subagent_id=subagent_id)
+            manager._subagents[subagent_id] = SubagentState(config=config, workspace_path=str(workspace))
+
+        remove_workspace = manager._remove_workspace
+
+        def flaky_remove(subagent_id):
+            if subagent_id == "sub_b":
+                raise PermissionError("busy")
+            remove_workspace(subagent_id)
+
+        manager._remove_workspace = flaky_remove
+
+        count = await manager.cleanup_all_async(remove_workspaces=True)
+
+        assert count == 3
+        assert manager._subagents == {}
+        assert not (manager.subagents_base / "sub_a").exists()
+        assert (manager.subagents_base / "sub_b").exists()
+        assert not (manager.subagents_base / "sub_c").exists()
+
+    def test_cleanup_all_without_loop_removes_workspaces(self, tmp_path):
+        """Test that the sync cleanup_all removes workspaces through the concurrent path."""
+        from massgen.subagent.manager import SubagentManager
+        from massgen.subagent.models import SubagentConfig, SubagentState
+
+        manager = SubagentManager(
+            parent_workspace=str(tmp_path),
+            parent_agent_id="test-agent",
+            orchestrator_id="test-orch",
+            parent_agent_configs=[],
+        )
+        for subagent_id in ("sub_a", "sub_b"):
+            workspace = manager._create_workspace(subagent_id)
+            config = SubagentConfig.create(task="task", parent_agent_id="test-agent", subagent_id=subagent_id)
+            manager._subagents[subagent_id] = SubagentState(config=config, workspace_path=str(workspace))
+
+        assert manager.cleanup_all(remove_workspaces=True) == 2
+        assert manager._subagents == {}
+        assert not (manager.subagents_base / "sub_a").exists()
+        assert not (manager.subagents_base / "sub_b").exists()
+
+
 # =============================================================================
 # Subagent Result Factory Tests (ensuring test fixtures are correct)
 # =============================================================================
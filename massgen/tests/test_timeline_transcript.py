@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the timeline transcript writer and renderers.
+
+Run with: uv run pytest massgen/tests/test_timeline_transcript.py -v
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from massgen.frontend.displays import timeline_transcript
+
+
+@pytest.fixture
+def transcript_path(tmp_path, monkeypatch):
+    """Point the transcript at a temp file and close the cached fd afterwards."""
+    path = tmp_path / "timeline.txt"
+    monkeypatch.setenv("MASSGEN_TUI_TIMELINE_TRANSCRIPT", str(path))
+    monkeypatch.delenv("MASSGEN_TUI_TIMELINE_EVENTS", raising=False)
+    timeline_transcript._close_fd()
+    yield path
+    timeline_transcript._close_fd()
+
+
+# =============================================================================
+# Sanitize Tests
+# =============================================================================
+
+
+class TestSanitize:
+    """Tests for _sanitize."""
+
+    def test_plain_line_unchanged(self):
+        """Test that a short single-line string passes through unchanged."""
+        assert timeline_transcript._sanitize("hello world") == "hello world"
+
+    def test_newlines_escaped_and_carriage_returns_dropped(self):
+        """Test that newlines are escaped and carriage returns removed."""
+        assert timeline_transcript._sanitize("a\nb") == "a\\nb"
+        assert timeline_transcript._sanitize("a\r\nb\r") == "a\\nb"
+
+    def test_long_multiline_truncated_like_full_escape(self):
+        """Test that escaping only the head gives the same result as escaping everything."""
+        text = "line\n" * 200
+        expected = timeline_transcript._truncate(text.replace("\n", "\\n"))
+
+        result = timeline_transcript._sanitize(text)
+
+        assert result == expected
+        assert len(result) == 200
+        assert result.endswith("...")
+
+
+# =============================================================================
+# Writer Tests
+# =============================================================================
+
+
+class TestWriteLine:
+    """Tests for the cached-fd transcript writer."""
+
+    def test_no_path_writes_nothing(self, tmp_path, monkeypatch):
+        """Test that nothing is opened when the transcript env var is unset."""
+        monkeypatch.delenv("MASSGEN_TUI_TIMELINE_TRANSCRIPT", raising=False)
+        timeline_transcript._close_fd()
+
+        timeline_transcript._write_line("ignored")
+
+        assert timeline_transcript._FD is None
+
+    def test_same_path_appends_through_one_fd(self, transcript_path):
+        """Test that repeated writes to one path reuse the fd and append."""
+        timeline_transcript._write_line("first")
+        fd = timeline_transcript._FD
+        timeline_transcript._write_line("second")
+
+        assert timeline_transcript._FD == fd
+        assert transcript_path.read_text() == "first\nsecond\n"
+
+    def test_path_change_reopens(self, transcript_path, tmp_path, monkeypatch):
+        """Test that changing the transcript path switches files."""
+        timeline_transcript._write_line("first")
+        other = tmp_path / "other.txt"
+        monkeypatch.setenv("MASSGEN_TUI_TIMELINE_TRANSCRIPT", str(other))
+
+        timeline_transcript._write_line("second")
+
+        assert transcript_path.read_text() == "first\n"
+        assert other.read_text() == "second\n"
+
+    def test_unlinked_file_is_recreated(self, transcript_path):
+        """Test that deleting the transcript mid-run does not lose later lines."""
+        timeline_transcript._write_line("first")
+        os.unlink(transcript_path)
+
+        timeline_transcript._write_line("second")
+
+        assert transcript_path.read_text() == "second\n"
+
+    def test_rotated_file_is_reopened(self, transcript_path):
+        """Test that a file rotated away from the path is not written to any more."""
+        timeline_transcript._write_line("first")
+        rotated = transcript_path.with_name("timeline.txt.1")
+        os.rename(transcript_path, rotated)
+        transcript_path.write_text("")
+
+        timeline_transcript._write_line("second")
+
+        assert rotated.read_text() == "first\n"
+        assert transcript_path.read_text() == "second\n"
+
+
+# =============================================================================
+# Render Tests
+# =============================================================================
+
+
+class TestRenderOutput:
+    """Tests for render_output dispatch."""
+
+    def test_separator(self):
+        """Test that separators render with label and subtitle."""
+        output = SimpleNamespace(output_type="separator", round_number=2, separator_label="Round 2", separator_subtitle="restart")
+        assert timeline_transcript.render_output(output) == ["[2] separator: Round 2 | restart"]
+
+    def test_text_types_use_text_class(self):
+        """Test that text-like outputs use their text class, defaulting to the output type."""
+        thinking = SimpleNamespace(output_type="thinking", round_number=1, text_content="hmm", text_class=None)
+        status = SimpleNamespace(output_type="status", round_number=1, text_content="ok", text_class="status-info")
+
+        assert timeline_transcript.render_output(thinking) == ["[1] thinking: hmm"]
+        assert timeline_transcript.render_output(status) == ["[1] status-info: ok"]
+
+    def test_final_answer(self):
+        """Test that final answers render with the final-answer label."""
+        output = SimpleNamespace(output_type="final_answer", round_number=3, text_content="42")
+        assert timeline_transcript.render_output(output) == ["[3] final-answer: 42"]
+
+    def test_tool_and_batch(self):
+        """Test that tools and tool batches render, and skip when their data is missing."""
+        tool = SimpleNamespace(tool_name="read_file", tool_id="t1", status="success", args_summary=None, result_summary="done")
+        tool_output = SimpleNamespace(output_type="tool", round_number=1, tool_data=tool, batch_action=None, batch_id=None, server_name=None)
+        batch_output = SimpleNamespace(output_type="tool_batch", round_number=1, batch_tools=[tool], batch_id="b1", server_name="fs")
+
+        assert timeline_transcript.render_output(tool_output) == ["[1] tool add | read_file | id=t1 | status=success | result=done"]
+        assert timeline_transcript.render_output(batch_output) == [
+            "[1] batch start | id=b1 | server=fs",
+            "[1] batch add | id=b1 | tool=read_file | tool_id=t1 | status=success",
+        ]
+        assert timeline_transcript.render_output(SimpleNamespace(output_type="tool", tool_data=None)) == []
+        assert timeline_transcript.render_output(SimpleNamespace(output_type="tool_batch", batch_tools=[])) == []
+
+    def test_unknown_type_renders_nothing(self):
+        """Test that unknown output types produce no lines."""
+        assert timeline_transcript.render_outputs([None, SimpleNamespace(output_type="mystery")]) == []
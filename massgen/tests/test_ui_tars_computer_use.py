@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for UI-TARS computer use helpers.
+
+Run with: uv run pytest massgen/tests/test_ui_tars_computer_use.py -v
+"""
+
+import io
+import tarfile
+import time
+from types import SimpleNamespace
+from typing import List, Optional
+
+from massgen.tool._ui_tars_computer_use.ui_tars_computer_use_tool import (
+    _MAX_HISTORY_SCREENSHOTS,
+    _PNG_IEND_CHUNK,
+    _drop_stale_screenshots,
+    _read_container_file,
+    take_screenshot_docker,
+)
+
+# A PNG-shaped payload: signature, filler past the 1000-byte sanity check, IEND chunk
+_COMPLETE_PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 2000 + b"\0\0\0\0" + _PNG_IEND_CHUNK
+_TRUNCATED_PNG = _COMPLETE_PNG[:1500]
+
+
+def _screenshot_message(index: int, prompt: Optional[str] = None) -> dict:
+    content = [{"type": "image_url", "image_url": {"url": f"data:image/png;base64,shot{index}"}}]
+    if prompt is not None:
+        content.insert(0, {"type": "text", "text": prompt})
+    return {"role": "user", "content": content}
+
+
+def _image_urls(messages: list) -> list:
+    return [part["image_url"]["url"] for msg in messages if msg["role"] == "user" for part in msg["content"] if part["type"] == "image_url"]
+
+
+# =============================================================================
+# Conversation History Tests
+# =============================================================================
+
+
+class TestDropStaleScreenshots:
+    """Tests for _drop_stale_screenshots."""
+
+    def test_keeps_only_last_screenshots(self):
+        """Test that only the newest _MAX_HISTORY_SCREENSHOTS images survive."""
+        messages = []
+        for i in range(_MAX_HISTORY_SCREENSHOTS + 3):
+            messages.append(_screenshot_message(i))
+            messages.append({"role": "assistant", "content": f"Action: step {i}"})
+
+        _drop_stale_screenshots(messages)
+
+        expected = [f"data:image/png;base64,shot{i}" for i in range(3, _MAX_HISTORY_SCREENSHOTS + 3)]
+        assert _image_urls(messages) == expected
+        assert messages[0]["content"] == [{"type": "text", "text": "[earlier screenshot omitted]"}]
+
+    def test_preserves_prompt_text_and_assistant_messages(self):
+        """Test that the prompt text part and every assistant response are kept."""
+        messages = [_screenshot_message(0, prompt="system prompt"), {"role": "assistant", "content": "Action: first"}]
+        messages += [_screenshot_message(i) for i in range(1, 4)]
+
+        _drop_stale_screenshots(messages, keep_last=2)
+
+        assert messages[0]["content"] == [
+            {"type": "text", "text": "system prompt"},
+            {"type": "text", "text": "[earlier screenshot omitted]"},
+        ]
+        assert messages[1] == {"role": "assistant", "content": "Action: first"}
+        assert _image_urls(messages) == ["data:image/png;base64,shot2", "data:image/png;base64,shot3"]
+
+    def test_repeated_calls_keep_compacting(self):
+        """Test that calling once per step matches compacting the full history at the end."""
+        messages = [_screenshot_message(0, prompt="system prompt")]
+        _drop_stale_screenshots(messages, keep_last=2)
+        for i in range(1, 6):
+            messages.append({"role": "assistant", "content": f"Action: step {i - 1}"})
+            messages.append(_screenshot_message(i))
+            _drop_stale_screenshots(messages, keep_last=2)
+            assert _image_urls(messages) == [f"data:image/png;base64,shot{j}" for j in range(max(0, i - 1), i + 1)]
+
+        assert messages[0]["content"][0] == {"type": "text", "text": "system prompt"}
+        assert [msg["content"] for msg in messages if msg["role"] == "assistant"] == [f"Action: step {i}" for i in range(5)]
+
+    def test_short_history_untouched(self):
+        """Test that a history within the limit is left as is."""
+        messages = [_screenshot_message(0, prompt="system prompt")]
+
+        _drop_stale_screenshots(messages)
+
+        assert messages == [_screenshot_message(0, prompt="system prompt")]
+
+
+# =============================================================================
+# Docker Screenshot Tests
+# =============================================================================
+
+
+def _tar_stream(payload: Optional[bytes], chunk_size: int = 512) -> List[bytes]:
+    """Build the chunked tar stream that container.get_archive returns."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        if payload is not None:
+            info = tarfile.TarInfo("screenshot.png")
+            info.size = len(payload)
+            archive.addfile(info, io.BytesIO(payload))
+    data = buffer.getvalue()
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+class _FakeContainer:
+    """Container stand-in whose archive reads return the queued payloads in order."""
+
+    def __init__(self, payloads: List[Optional[bytes]], archive_error: Optional[Exception] = None):
+        self._payloads = list(payloads)
+        self._archive_error = archive_error
+        self.archive_reads = 0
+
+    def exec_run(self, cmd, environment=None):
+        return SimpleNamespace(exit_code=0, output=b"")
+
+    def get_archive(self, path):
+        self.archive_reads += 1
+        if self._archive_error is not None:
+            raise self._archive_error
+        payload = self._payloads.pop(0) if len(self._payloads) > 1 else self._payloads[0]
+        return iter(_tar_stream(payload)), {"name": "screenshot.png"}
+
+
+class TestDockerScreenshot:
+    """Tests for _read_container_file and take_screenshot_docker."""
+
+    def test_read_container_file_extracts_member(self):
+        """Test that the archive read returns the single file's bytes."""
+        assert _read_container_file(_FakeContainer([b"hello"]), "/tmp/file") == b"hello"
+
+    def test_read_container_file_empty_archive(self):
+        """Test that an archive without members reads as empty bytes."""
+        assert _read_container_file(_FakeContainer([None]), "/tmp/file") == b""
+
+    def test_complete_png_read_once(self, monkeypatch):
+        """Test that a complete PNG is accepted on the first read without sleeping."""
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        container = _FakeContainer([_COMPLETE_PNG])
+
+        assert take_screenshot_docker(container) == _COMPLETE_PNG
+        assert container.archive_reads == 1
+        assert sleeps == []
+
+    def test_truncated_png_is_reread(self, monkeypatch):
+        """Test that a PNG without its IEND chunk is read again until complete."""
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        container = _FakeContainer([_TRUNCATED_PNG, _COMPLETE_PNG])
+
+        assert take_screenshot_docker(container) == _COMPLETE_PNG
+        assert container.archive_reads == 2
+        assert sleeps == [0.04]
+
+    def test_empty_archive_gives_up(self, monkeypatch):
+        """Test that an empty archive is retried briefly and then reported as no screenshot."""
+        monkeypatch.setattr(time, "sleep", lambda _: None)
+        container = _FakeContainer([None])
+
+        assert take_screenshot_docker(container) == b""
+        assert container.archive_reads == 5
+
+    def test_archive_error_returns_empty(self, monkeypatch):
+        """Test that a failing get_archive returns empty bytes instead of raising."""
+        monkeypatch.setattr(time, "sleep", lambda _: None)
+        container = _FakeContainer([], archive_error=RuntimeError("no such file"))
+
+        assert take_screenshot_docker(container) == b""
+        assert container.archive_reads == 1
@@ -129,15 +129,22 @@ class APICallMetric:
     call_index: int  # Which API call in this round (0-indexed)
     backend_name: str  # "OpenAI", "Anthropic", "Google", etc.
     model: str
-    start_time: float
+    start_time: float  # Wall clock, for display/serialization only
     end_time: float = 0.0
     time_to_first_token_ms: float = 0.0  # TTFT for streaming
     success: bool = True
     error_message: Optional[str] = None
 
+    # Monotonic nanosecond clocks used for durations (immune to wall-clock skew)
+    start_mono_ns: int = 0
+    first_token_mono_ns: int = 0
+    end_mono_ns: int = 0
+
     @property
     def duration_ms(self) -> float:
         """Total API call duration in milliseconds."""
+        if self.end_mono_ns and self.start_mono_ns:
+            return (self.end_mono_ns - self.start_mono_ns) / 1e6
         return (self.end_time - self.start_time) * 1000 if self.end_time else 0
 
     def to_dict(self) -> Dict[str, Any]:
@@ -11,11 +11,14 @@ This tool implements computer control using ByteDance's UI-TARS-1.5 model which
 
 import asyncio
 import base64
+import functools
+import io
 import json
 import os
 import re
+import tarfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 
@@ -24,12 +27,14 @@ from massgen.tool._result import ExecutionResult, TextContent
 
 # Optional dependencies with graceful fallback
 try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     from playwright.async_api import async_playwright
 
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     async_playwright = None
+    PlaywrightTimeoutError = None
 
 try:
     from openai import OpenAI
@@ -64,6 +69,16 @@ except ImportError:
 SCREEN_WIDTH = 1440
 SCREEN_HEIGHT = 900
 
+# Response parsing patterns, compiled once since they run on every model step
+_BOX_COORDS_PATTERN = re.compile(r"(start_box|end_box)='\((\d+),\s*(\d+)\)'")
+_THOUGHT_PATTERN = re.compile(r"Thought:\s*(.+?)(?=\nAction:|$)", re.DOTALL)
+_ACTION_PATTERN = re.compile(r"Action:\s*(.+)", re.DOTALL)
+_START_BOX_PATTERN = re.compile(r"start_box=['\"]?\(?(\d+),\s*(\d+)\)?['\"]?")
+_END_BOX_PATTERN = re.compile(r"end_box=['\"]?\(?(\d+),\s*(\d+)\)?['\"]?")
+_TEXT_ARG_PATTERN = re.compile(r"(?:text|content)=['\"]([^'\"]+)['\"]")
+_KEY_ARG_PATTERN = re.compile(r"(?:text|content|key)=['\"]([^'\"]+)['\"]")
+_DIRECTION_ARG_PATTERN = re.compile(r"direction=['\"]([^'\"]+)['\"]")
+
 # UI-TARS prompt templates (from official repo)
 COMPUTER_USE_PROMPT = """You are a GUI agent. You are asked to complete a task by interacting with a computer interface.
 
@@ -92,12 +107,71 @@ Screen resolution: {width}x{height}
 Task: {task}
 """
 
+# Screenshots kept in the conversation history, as in the UI-TARS reference agent
+_MAX_HISTORY_SCREENSHOTS = 5
+_OMITTED_SCREENSHOT_PART = {"type": "text", "text": "[earlier screenshot omitted]"}
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load the project .env (or the nearest one found) once per process.
+
+    load_dotenv never overrides variables that are already set, so repeating
+    it on every task only re-reads the same file.
+    """
+    script_dir = Path(__file__).parent.parent.parent.parent
+    env_path = script_dir / ".env"
+    if env_path.exists():
+        load_dotenv(env_path)
+    else:
+        load_dotenv()
+
+
+@functools.cache
+def _get_docker_client() -> "docker.DockerClient":
+    """Return a process-wide Docker client.
+
+    ``docker.from_env()`` negotiates the API version with the daemon, so it is
+    done once rather than on every task. Failures are not cached.
+    """
+    return docker.from_env()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(api_key: str, base_url: str) -> "OpenAI":
+    """Return a shared OpenAI-compatible client for an endpoint.
+
+    The client owns an HTTP connection pool, so reusing it across tasks keeps
+    keep-alive connections (and their TLS sessions) to the endpoint warm.
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
+
 
 def encode_image_base64(image_bytes: bytes) -> str:
     """Encode image bytes to base64 string for API calls."""
     return base64.b64encode(image_bytes).decode("utf-8")
 
 
+def _drop_stale_screenshots(messages: List[Dict[str, Any]], keep_last: int = _MAX_HISTORY_SCREENSHOTS) -> None:
+    """Replace screenshots older than the last ``keep_last`` with a text placeholder.
+
+    Every request re-sends the whole conversation, so without this the upload
+    grows with each step. Text parts and assistant responses are kept.
+    """
+    kept = 0
+    for msg in reversed(messages):
+        if msg.get("role") != "user":
+            continue
+        content = msg["content"]
+        if not any(part.get("type") == "image_url" for part in content):
+            # Older messages were already compacted on earlier steps
+            break
+        if kept < keep_last:
+            kept += 1
+            continue
+        msg["content"] = [_OMITTED_SCREENSHOT_PART if part.get("type") == "image_url" else part for part in content]
+
+
 def add_box_token(input_string: str) -> str:
     """Add box tokens to coordinates in UI-TARS format (required by model).
 
@@ -110,7 +184,7 @@ def add_box_token(input_string: str) -> str:
         for action in actions:
             action = action.strip()
             # Extract coordinates using regex
-            coordinates = re.findall(r"(start_box|end_box)='\((\d+),\s*(\d+)\)'", action)
+            coordinates = _BOX_COORDS_PATTERN.findall(action)
 
             updated_action = action
             for coord_type, x, y in coordinates:
@@ -141,8 +215,8 @@ def parse_ui_tars_response(response: str, screen_width: int, screen_height: int)
     result = {"thought": "", "action": "", "parsed_action": None}
 
     # Extract thought and action
-    thought_match = re.search(r"Thought:\s*(.+?)(?=\nAction:|$)", response, re.DOTALL)
-    action_match = re.search(r"Action:\s*(.+)", response, re.DOTALL)
+    thought_match = _THOUGHT_PATTERN.search(response)
+    action_match = _ACTION_PATTERN.search(response)
 
     if thought_match:
         result["thought"] = thought_match.group(1).strip()
@@ -153,13 +227,14 @@ def parse_ui_tars_response(response: str, screen_width: int, screen_height: int)
     action_text = result["action"]
 
     # Check for completion/failure
-    if "DONE" in action_text.upper() or "finished()" in action_text.lower():
+    action_upper = action_text.upper()
+    if "DONE" in action_upper or "finished()" in action_text.lower():
         result["parsed_action"] = {"type": "done"}
         return result
-    if "FAIL" in action_text.upper():
+    if "FAIL" in action_upper:
         result["parsed_action"] = {"type": "fail"}
         return result
-    if "WAIT" in action_text.upper():
+    if "WAIT" in action_upper:
         result["parsed_action"] = {"type": "wait", "duration": 2}
         return result
 
@@ -174,15 +249,15 @@ def parse_ui_tars_response(response: str, screen_width: int, screen_height: int)
             action_type = "click"
 
         # Extract coordinates
-        coord_match = re.search(r"start_box=['\"]?\(?(\d+),\s*(\d+)\)?['\"]?", action_text)
+        coord_match = _START_BOX_PATTERN.search(action_text)
         if coord_match:
             x, y = int(coord_match.group(1)), int(coord_match.group(2))
             result["parsed_action"] = {"type": action_type, "x": x, "y": y}
 
     elif "drag(" in action_text:
         # Extract start and end coordinates
-        start_match = re.search(r"start_box=['\"]?\(?(\d+),\s*(\d+)\)?['\"]?", action_text)
-        end_match = re.search(r"end_box=['\"]?\(?(\d+),\s*(\d+)\)?['\"]?", action_text)
+        start_match = _START_BOX_PATTERN.search(action_text)
+        end_match = _END_BOX_PATTERN.search(action_text)
         if start_match and end_match:
             x1, y1 = int(start_match.group(1)), int(start_match.group(2))
             x2, y2 = int(end_match.group(1)), int(end_match.group(2))
@@ -190,27 +265,45 @@ def parse_ui_tars_response(response: str, screen_width: int, screen_height: int)
 
     elif "type(" in action_text:
         # Extract text to type - support both 'text=' and 'content=' parameters
-        text_match = re.search(r"(?:text|content)=['\"]([^'\"]+)['\"]", action_text)
+        text_match = _TEXT_ARG_PATTERN.search(action_text)
         if text_match:
             text = text_match.group(1)
             result["parsed_action"] = {"type": "type", "text": text}
 
     elif "key(" in action_text:
         # Extract key to press - support 'text=', 'content=', and 'key=' parameters
-        key_match = re.search(r"(?:text|content|key)=['\"]([^'\"]+)['\"]", action_text)
+        key_match = _KEY_ARG_PATTERN.search(action_text)
         if key_match:
             key = key_match.group(1)
             result["parsed_action"] = {"type": "key", "key": key}
 
     elif "scroll(" in action_text:
         # Extract scroll direction
-        dir_match = re.search(r"direction=['\"]([^'\"]+)['\"]", action_text)
+        dir_match = _DIRECTION_ARG_PATTERN.search(action_text)
         direction = dir_match.group(1) if dir_match else "down"
         result["parsed_action"] = {"type": "scroll", "direction": direction}
 
     return result
 
 
+# Trailing IEND chunk (type + CRC) that ends every complete PNG file
+_PNG_IEND_CHUNK = b"IEND\xaeB`\x82"
+
+
+def _read_container_file(container, path: str) -> bytes:
+    """Read a single file out of a Docker container.
+
+    Uses the archive API, a single HTTP request, rather than ``exec_run("cat")``,
+    which needs an exec create/start/inspect round trip and a process in the
+    container.
+    """
+    stream, _ = container.get_archive(path)
+    with tarfile.open(fileobj=io.BytesIO(b"".join(stream))) as archive:
+        member = archive.next()
+        extracted = archive.extractfile(member) if member else None
+        return extracted.read() if extracted else b""
+
+
 def take_screenshot_docker(container, display: str = ":99") -> bytes:
     """Take a screenshot from Docker container using scrot.
 
@@ -223,12 +316,10 @@ def take_screenshot_docker(container, display: str = ":99") -> bytes:
     """
     import time
 
-    # Remove old screenshot if exists
-    container.exec_run("rm -f /tmp/screenshot.png")
-
-    # Take screenshot with scrot
+    # Remove old screenshot (scrot would otherwise write a suffixed copy) and
+    # take a new one with scrot, in a single exec
     result = container.exec_run(
-        "scrot /tmp/screenshot.png",
+        ["sh", "-c", "rm -f /tmp/screenshot.png && scrot /tmp/screenshot.png"],
         environment={"DISPLAY": display},
     )
 
@@ -243,16 +334,18 @@ def take_screenshot_docker(container, display: str = ":99") -> bytes:
             logger.error(f"Alternative screenshot also failed: {result.output}")
             return b""
 
-    # Small delay to ensure file is written
-    time.sleep(0.2)
-
-    # Read the screenshot
-    read_result = container.exec_run("cat /tmp/screenshot.png", stdout=True)
-    if read_result.exit_code != 0:
-        logger.error(f"Failed to read screenshot: {read_result.output}")
-        return b""
-
-    screenshot_bytes = read_result.output
+    # The capture command has exited, so the file is normally complete on the
+    # first read; poll briefly (same 0.2s worst case) instead of always sleeping
+    screenshot_bytes = b""
+    for _ in range(5):
+        try:
+            screenshot_bytes = _read_container_file(container, "/tmp/screenshot.png")
+        except Exception as e:
+            logger.error(f"Failed to read screenshot: {e}")
+            return b""
+        if screenshot_bytes.startswith(b"\x89PNG") and screenshot_bytes.endswith(_PNG_IEND_CHUNK):
+            break
+        time.sleep(0.04)
 
     # Verify we got actual image data
     if len(screenshot_bytes) < 1000:
@@ -411,9 +504,10 @@ def execute_docker_action(container, action: Dict[str, Any], screen_width: int,
 
         elif action_type == "type":
             text = action.get("text", "")
-            escaped_text = text.replace("'", "'\\''")
+            # Pass the text as its own argv entry so it needs no quoting;
+            # "--" keeps text starting with "-" from being read as an option
             container.exec_run(
-                f"xdotool type '{escaped_text}'",
+                ["xdotool", "type", "--", text],
                 environment={"DISPLAY": display},
             )
             logger.info(f"     Docker typed: {text}")
@@ -566,12 +660,7 @@ async def ui_tars_computer_use(
 
     try:
         # Load environment variables
-        script_dir = Path(__file__).parent.parent.parent.parent
-        env_path = script_dir / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
-        else:
-            load_dotenv()
+        _load_env()
 
         # Get API credentials
         api_key = os.getenv("UI_TARS_API_KEY")
@@ -598,10 +687,7 @@ async def ui_tars_computer_use(
         if not endpoint.endswith("/v1"):
             endpoint = endpoint.rstrip("/") + "/v1"
 
-        client = OpenAI(
-            api_key=api_key,
-            base_url=endpoint,
-        )
+        client = _get_client(api_key, endpoint)
 
         # Initialize environment (browser or Docker)
         container = None
@@ -616,7 +702,7 @@ async def ui_tars_computer_use(
             container_name = environment_config.get("container_name", "cua-container")
             display = environment_config.get("display", ":99")
 
-            docker_client = docker.from_env()
+            docker_client = _get_docker_client()
             try:
                 container = docker_client.containers.get(container_name)
                 if container.status != "running":
@@ -653,14 +739,15 @@ async def ui_tars_computer_use(
                     # Navigate to URL: Ctrl+L to focus address bar, type URL, press Enter
                     container.exec_run("xdotool key ctrl+l", environment={"DISPLAY": display})
                     time.sleep(0.5)
-                    escaped_url = initial_url.replace("'", "'\\''")
-                    container.exec_run(f"xdotool type '{escaped_url}'", environment={"DISPLAY": display})
+                    container.exec_run(["xdotool", "type", "--", initial_url], environment={"DISPLAY": display})
                     time.sleep(0.5)
                     container.exec_run("xdotool key Return", environment={"DISPLAY": display})
                     time.sleep(3)  # Wait for page to load
                     logger.info("Initial URL navigation complete")
                 except Exception as e:
                     logger.warning(f"Failed to navigate to initial URL: {e}")
+                # The display changed since the check above; capture it afresh
+                initial_screenshot = None
 
         else:  # browser
             # Browser environment
@@ -685,11 +772,15 @@ async def ui_tars_computer_use(
 
             # Navigate to initial URL
             if initial_url:
-                await page.goto(initial_url, wait_until="networkidle", timeout=30000)
+                await page.goto(initial_url, wait_until="load", timeout=30000)
+                # Let late requests settle, without waiting on pages that never go idle
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=3000)
+                except PlaywrightTimeoutError:
+                    pass
             else:
                 await page.goto("about:blank")
 
-            await asyncio.sleep(1)
             initial_screenshot = await page.screenshot()
 
         # Build system prompt
@@ -712,8 +803,10 @@ async def ui_tars_computer_use(
             iteration += 1
             logger.info(f"\n=== Iteration {iteration}/{max_iterations} ===")
 
-            # Take screenshot
-            if environment == "linux":
+            # Take screenshot (the first iteration reuses the setup capture when still current)
+            if initial_screenshot is not None:
+                screenshot_bytes, initial_screenshot = initial_screenshot, None
+            elif environment == "linux":
                 screenshot_bytes = take_screenshot_docker(container, display)
             else:
                 screenshot_bytes = await page.screenshot()
@@ -751,6 +844,7 @@ async def ui_tars_computer_use(
                 }
 
             messages.append(user_message)
+            _drop_stale_screenshots(messages)
 
             # Call UI-TARS API
             try:
@@ -761,13 +855,18 @@ async def ui_tars_computer_use(
                     if msg.get("role") == "assistant":
                         msg["content"] = add_box_token(msg["content"])
 
-                response = client.chat.completions.create(
-                    model="ByteDance-Seed/UI-TARS-1.5-7B",  # Full model ID from HuggingFace endpoint
-                    messages=messages,
-                    temperature=0.0,
-                    top_p=None,
-                    max_tokens=400,
-                    stream=False,
+                # The client is synchronous; run the request (and its upload) off the event loop
+                response = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    functools.partial(
+                        client.chat.completions.create,
+                        model="ByteDance-Seed/UI-TARS-1.5-7B",  # Full model ID from HuggingFace endpoint
+                        messages=messages,
+                        temperature=0.0,
+                        top_p=None,
+                        max_tokens=400,
+                        stream=False,
+                    ),
                 )
 
                 response_text = response.choices[0].message.content
@@ -25,6 +25,15 @@ from typing import Optional
 from massgen.events import MassGenEvent
 from massgen.frontend.displays.timeline_event_recorder import TimelineEventRecorder
 
+# orjson is optional; it parses large events.jsonl files noticeably faster.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def load_events(path: Path) -> list[MassGenEvent]:
     events = []
@@ -34,7 +43,7 @@ def load_events(path: Path) -> list[MassGenEvent]:
             if not line:
                 continue
             try:
-                payload = json.loads(line)
+                payload = _json_loads(line)
             except json.JSONDecodeError:
                 continue
             events.append(
@@ -148,12 +157,14 @@ def run_tui(events: list[MassGenEvent], agent_ids: set[str]) -> int:
             self._current_idx = 0
             self._timelines: dict[str, TimelineSection] = {}
             self._adapters: dict[str, TimelineEventAdapter] = {}
+            self._tab_buttons: dict[str, Button] = {}
 
         def compose(self) -> ComposeResult:
             yield Header()
             with Horizontal(id="tab-bar"):
                 for i, aid in enumerate(self._agents):
                     btn = Button(aid, id=f"tab-{aid}", classes="active" if i == 0 else "")
+                    self._tab_buttons[aid] = btn
                     yield btn
             yield Static(
                 f"{len(events)} events  |  {len(self._agents)} agents",
@@ -169,22 +180,20 @@ def run_tui(events: list[MassGenEvent], agent_ids: set[str]) -> int:
 
         def on_mount(self) -> None:
             self.title = "Event Replay"
-            # Build per-agent adapters and replay with agent_id filtering
+            # Build per-agent adapters
             for aid in self._agents:
-                tl = self._timelines[aid]
-                panel = _FakePanel(aid, tl)
-                adapter = TimelineEventAdapter(panel, agent_id=aid)
-                self._adapters[aid] = adapter
-
-                # Replay events, applying same agent_id gate as live TUI
-                for event in events:
-                    if event.event_type in ("timeline_entry", "stream_chunk"):
-                        continue
-                    if not event.agent_id or event.agent_id not in agent_ids:
-                        continue
-                    # Only route to this agent's adapter if event is for this agent
-                    if event.agent_id == aid:
-                        adapter.handle_event(event)
+                panel = _FakePanel(aid, self._timelines[aid])
+                self._adapters[aid] = TimelineEventAdapter(panel, agent_id=aid)
+
+            # Replay events in one pass, routing each to its agent's adapter
+            # (same agent_id gate as live TUI)
+            for event in events:
+                if event.event_type in ("timeline_entry", "stream_chunk"):
+                    continue
+                adapter = self._adapters.get(event.agent_id)
+                if adapter is not None:
+                    adapter.handle_event(event)
+            for adapter in self._adapters.values():
                 adapter.flush()
 
         def _switch_to(self, idx: int) -> None:
@@ -193,9 +202,8 @@ def run_tui(events: list[MassGenEvent], agent_ids: set[str]) -> int:
             new_aid = self._agents[self._current_idx]
             self._timelines[old_aid].display = False
             self._timelines[new_aid].display = True
-            for i, aid in enumerate(self._agents):
-                btn = self.query_one(f"#tab-{aid}", Button)
-                btn.set_classes("active" if i == self._current_idx else "")
+            self._tab_buttons[old_aid].remove_class("active")
+            self._tab_buttons[new_aid].add_class("active")
 
         def on_button_pressed(self, event: Button.Pressed) -> None:
             bid = event.button.id or ""